@@ -291,6 +291,7 @@ this level.
 - mcp__sre__pagerduty_list_incidents: Check for existing
 incidents before creating new ones
 - mcp__sre__pagerduty_create_incident: Create a new incident to page oncall
+- mcp__sre__pagerduty_create_incidents_bulk: Create several incidents at once
 - mcp__sre__pagerduty_update_incident: Acknowledge or resolve incidents
 - mcp__sre__pagerduty_get_incident: Get details of a specific incident
 
@@ -442,6 +443,7 @@ async def process_investigation(
             "mcp__sre__execute_runbook",
             # PagerDuty tools
             "mcp__sre__pagerduty_create_incident",
+            "mcp__sre__pagerduty_create_incidents_bulk",
             "mcp__sre__pagerduty_update_incident",
             "mcp__sre__pagerduty_get_incident",
             "mcp__sre__pagerduty_list_incidents",
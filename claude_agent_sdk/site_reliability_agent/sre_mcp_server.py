@@ -15,19 +15,36 @@ The server implements:
 """
 
 import asyncio
+import atexit
 import base64
+import functools
 import html
+import importlib.util
 import json
 import os
-import shlex
+import shutil
+import signal
 import sys
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+# orjson encodes and parses JSON-RPC messages and PagerDuty payloads several
+# times faster than json
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -41,8 +58,25 @@ PROMETHEUS_URL = "http://localhost:9090"
 # PagerDuty configuration
 PAGERDUTY_API_KEY = os.getenv("PAGERDUTY_API_KEY")
 PAGERDUTY_SERVICE_ID = os.getenv("PAGERDUTY_SERVICE_ID")
-PAGERDUTY_FROM_EMAIL = os.getenv("PAGERDUTY_FROM_EMAIL")
+PAGERDUTY_FROM_EMAIL = os.getenv("PAGERDUTY_FROM_EMAIL") or "sre-bot@example.com"
 PAGERDUTY_BASE_URL = "https://api.pagerduty.com"
+# Seconds an idle PagerDuty connection is kept open for reuse (httpx defaults to 5)
+PAGERDUTY_HTTPX_KEEPALIVE = float(os.getenv("PAGERDUTY_HTTPX_KEEPALIVE", "15"))
+# Seconds a PagerDuty read (list/get incident) is served from cache
+PAGERDUTY_CACHE_TTL = float(os.getenv("PAGERDUTY_CACHE_TTL", "15"))
+PAGERDUTY_CACHE_MAX_ENTRIES = 256
+# Incidents from a fresh list response that also warm the get_incident cache
+PAGERDUTY_PREFETCH_COUNT = 5
+# Most pages pagerduty_list_incidents will follow in one call
+PAGERDUTY_LIST_MAX_PAGES = 10
+# Maximum concurrent requests for pagerduty_create_incidents_bulk
+PAGERDUTY_BULK_CONCURRENCY = 10
+# Retries for connection failures, 429s, and (for GET/PUT) 5xx responses
+PAGERDUTY_MAX_RETRIES = 3
+# Longest wait between retries, whatever Retry-After asks for
+PAGERDUTY_MAX_RETRY_DELAY = 30.0
+# Client-side request rate cap, kept under PagerDuty's 2000 requests/minute limit
+PAGERDUTY_MAX_RPS = float(os.getenv("PAGERDUTY_MAX_RPS", "30"))
 
 # Confluence configuration
 CONFLUENCE_BASE_URL = os.getenv("CONFLUENCE_BASE_URL")
@@ -419,6 +453,40 @@ if PAGERDUTY_API_KEY:
                     "required": ["title", "description"],
                 },
             },
+            {
+                "name": "pagerduty_create_incidents_bulk",
+                "description": """Create several PagerDuty incidents at once.
+    Use this instead of repeated pagerduty_create_incident calls when an
+    investigation finds multiple independent critical issues.
+    Incidents are created concurrently; returns the ID and URL of each,
+    and lists any that failed.""",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "incidents": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "title": {"type": "string"},
+                                    "description": {"type": "string"},
+                                    "urgency": {
+                                        "type": "string",
+                                        "enum": ["high", "low"],
+                                    },
+                                    "service_id": {"type": "string"},
+                                },
+                                "required": ["title", "description"],
+                            },
+                            "description": (
+                                "Incidents to create, each with the same fields"
+                                " as pagerduty_create_incident"
+                            ),
+                        },
+                    },
+                    "required": ["incidents"],
+                },
+            },
             {
                 "name": "pagerduty_update_incident",
                 "description": """Update a PagerDuty incident status.
@@ -483,6 +551,12 @@ if PAGERDUTY_API_KEY:
                             "type": "string",
                             "description": "Filter to a specific service (optional)",
                         },
+                        "max_pages": {
+                            "type": "integer",
+                            "description": (
+                                "Pages of 25 incidents to fetch (default: 1, max: 10)"
+                            ),
+                        },
                     },
                     "required": [],
                 },
@@ -624,6 +698,14 @@ if CONFLUENCE_BASE_URL and CONFLUENCE_API_TOKEN:
 
 # Project root directory (for config file operations)
 PROJECT_ROOT = Path(__file__).resolve().parent
+# The only directory the config tools may read or edit
+CONFIG_ROOT = (PROJECT_ROOT / "config").resolve()
+
+
+@functools.cache
+def docker_compose_executable() -> str:
+    """Resolve the docker-compose binary once so log fetches skip the PATH search."""
+    return shutil.which("docker-compose") or "docker-compose"
 
 
 async def query_metrics(promql: str) -> dict[str, Any]:
@@ -769,135 +851,165 @@ async def list_metrics() -> dict[str, Any]:
         }
 
 
+# How long an all-healthy summary is reused before Prometheus is scraped again
+HEALTHY_CACHE_SECONDS = 5.0
+_healthy_until = 0.0
+_healthy_response: dict[str, Any] | None = None
+
+
+def prometheus_result(response: httpx.Response) -> list[dict[str, Any]] | None:
+    """Return the result vector of a Prometheus query response, or None if it failed."""
+    if response.status_code != 200:
+        return None
+    data = response.json()
+    if data.get("status") != "success":
+        return None
+    return data.get("data", {}).get("result", [])
+
+
 async def get_service_health() -> dict[str, Any]:
     """Get a comprehensive health summary across all services."""
+    global _healthy_until, _healthy_response
+
+    if _healthy_response is not None and time.monotonic() < _healthy_until:
+        return _healthy_response
+
     health_lines = ["=== Service Health Summary ===", ""]
     issues = []
+    scrape_complete = True
 
     async with httpx.AsyncClient() as client:
         # Check error rates
         try:
-            response = await client.get(
-                f"{PROMETHEUS_URL}/api/v1/query",
-                params={
-                    "query": (
-                        'sum(rate(http_requests_total'
-                        '{status="500"}[1m]))'
-                        ' by (service)'
-                    )
-                },
-                timeout=10.0,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data["status"] == "success" and data["data"]["result"]:
-                    health_lines.append("ERROR RATES (errors/sec):")
-                    for r in data["data"]["result"]:
-                        service = r["metric"].get("service", "unknown")
-                        rate = float(r["value"][1])
-                        status = (
-                            "[CRITICAL]"
-                            if rate > 5
-                            else "[WARNING]"
-                            if rate > 1
-                            else "[OK]"
+            result = prometheus_result(
+                await client.get(
+                    f"{PROMETHEUS_URL}/api/v1/query",
+                    params={
+                        "query": (
+                            'sum(rate(http_requests_total'
+                            '{status="500"}[1m]))'
+                            ' by (service)'
                         )
-                        health_lines.append(f"  {status} {service}: {rate:.2f}/sec")
-                        if rate > 5:
-                            issues.append(
-                                f"High error rate on {service}: {rate:.1f}/sec"
-                            )
-                    health_lines.append("")
+                    },
+                    timeout=10.0,
+                )
+            )
+            if result is None:
+                scrape_complete = False
+            elif result:
+                health_lines.append("ERROR RATES (errors/sec):")
+                for r in result:
+                    service = r["metric"].get("service", "unknown")
+                    rate = float(r["value"][1])
+                    status = (
+                        "[CRITICAL]"
+                        if rate > 5
+                        else "[WARNING]"
+                        if rate > 1
+                        else "[OK]"
+                    )
+                    health_lines.append(f"  {status} {service}: {rate:.2f}/sec")
+                    if rate > 5:
+                        issues.append(f"High error rate on {service}: {rate:.1f}/sec")
+                health_lines.append("")
         except Exception as e:
+            scrape_complete = False
             health_lines.append(f"ERROR RATES: unable to query ({e})")
             health_lines.append("")
 
         # Check latency
         try:
-            response = await client.get(
-                f"{PROMETHEUS_URL}/api/v1/query",
-                params={
-                    "query": (
-                        "histogram_quantile(0.99,"
-                        " rate(http_request_duration"
-                        "_milliseconds_bucket[1m]))"
-                    )
-                },
-                timeout=10.0,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data["status"] == "success" and data["data"]["result"]:
-                    health_lines.append("LATENCY P99:")
-                    for r in data["data"]["result"]:
-                        service = r["metric"].get("service", "unknown")
-                        latency = float(r["value"][1])
-                        status = (
-                            "[CRITICAL]"
-                            if latency > 1000
-                            else "[WARNING]"
-                            if latency > 500
-                            else "[OK]"
+            result = prometheus_result(
+                await client.get(
+                    f"{PROMETHEUS_URL}/api/v1/query",
+                    params={
+                        "query": (
+                            "histogram_quantile(0.99,"
+                            " rate(http_request_duration"
+                            "_milliseconds_bucket[1m]))"
                         )
-                        health_lines.append(f"  {status} {service}: {latency:.0f}ms")
-                        if latency > 1000:
-                            issues.append(f"High latency on {service}: {latency:.0f}ms")
-                    health_lines.append("")
+                    },
+                    timeout=10.0,
+                )
+            )
+            if result is None:
+                scrape_complete = False
+            elif result:
+                health_lines.append("LATENCY P99:")
+                for r in result:
+                    service = r["metric"].get("service", "unknown")
+                    latency = float(r["value"][1])
+                    status = (
+                        "[CRITICAL]"
+                        if latency > 1000
+                        else "[WARNING]"
+                        if latency > 500
+                        else "[OK]"
+                    )
+                    health_lines.append(f"  {status} {service}: {latency:.0f}ms")
+                    if latency > 1000:
+                        issues.append(f"High latency on {service}: {latency:.0f}ms")
+                health_lines.append("")
         except Exception as e:
+            scrape_complete = False
             health_lines.append(f"LATENCY P99: unable to query ({e})")
             health_lines.append("")
 
         # Check DB connections
         try:
-            response = await client.get(
-                f"{PROMETHEUS_URL}/api/v1/query",
-                params={"query": "db_connections_active"},
-                timeout=10.0,
+            result = prometheus_result(
+                await client.get(
+                    f"{PROMETHEUS_URL}/api/v1/query",
+                    params={"query": "db_connections_active"},
+                    timeout=10.0,
+                )
             )
-            if response.status_code == 200:
-                data = response.json()
-                if data["status"] == "success" and data["data"]["result"]:
-                    active = float(data["data"]["result"][0]["value"][1])
-                    status = (
-                        "[CRITICAL]"
-                        if active > 90
-                        else "[WARNING]"
-                        if active > 70
-                        else "[OK]"
-                    )
-                    health_lines.append("DATABASE CONNECTIONS:")
-                    health_lines.append(f"  {status}: {active:.0f}/100 active")
-                    if active > 90:
-                        issues.append(
-                            f"DB connection pool near exhaustion: {active:.0f}/100"
-                        )
-                    health_lines.append("")
+            if result is None:
+                scrape_complete = False
+            elif result:
+                active = float(result[0]["value"][1])
+                status = (
+                    "[CRITICAL]"
+                    if active > 90
+                    else "[WARNING]"
+                    if active > 70
+                    else "[OK]"
+                )
+                health_lines.append("DATABASE CONNECTIONS:")
+                health_lines.append(f"  {status}: {active:.0f}/100 active")
+                if active > 90:
+                    issues.append(f"DB connection pool near exhaustion: {active:.0f}/100")
+                health_lines.append("")
         except Exception as e:
+            scrape_complete = False
             health_lines.append(f"DATABASE CONNECTIONS: unable to query ({e})")
             health_lines.append("")
 
         # Check service up status
         try:
-            response = await client.get(
-                f"{PROMETHEUS_URL}/api/v1/query",
-                params={"query": "up"},
-                timeout=10.0,
+            result = prometheus_result(
+                await client.get(
+                    f"{PROMETHEUS_URL}/api/v1/query",
+                    params={"query": "up"},
+                    timeout=10.0,
+                )
             )
-            if response.status_code == 200:
-                data = response.json()
-                if data["status"] == "success" and data["data"]["result"]:
-                    health_lines.append("SERVICE STATUS:")
-                    for r in data["data"]["result"]:
-                        service = r["metric"].get(
-                            "service", r["metric"].get("job", "unknown")
-                        )
-                        is_up = int(float(r["value"][1])) == 1
-                        status = "[UP]" if is_up else "[DOWN]"
-                        health_lines.append(f"  {status}: {service}")
-                        if not is_up:
-                            issues.append(f"Service down: {service}")
-                    health_lines.append("")
+            if result is None:
+                scrape_complete = False
+            elif result:
+                health_lines.append("SERVICE STATUS:")
+                for r in result:
+                    service = r["metric"].get(
+                        "service", r["metric"].get("job", "unknown")
+                    )
+                    is_up = int(float(r["value"][1])) == 1
+                    status = "[UP]" if is_up else "[DOWN]"
+                    health_lines.append(f"  {status}: {service}")
+                    if not is_up:
+                        issues.append(f"Service down: {service}")
+                health_lines.append("")
         except Exception as e:
+            scrape_complete = False
             health_lines.append(f"SERVICE STATUS: unable to query ({e})")
             health_lines.append("")
 
@@ -910,7 +1022,17 @@ async def get_service_health() -> dict[str, Any]:
     else:
         health_lines.append("All systems healthy")
 
-    return {"content": [{"type": "text", "text": "\n".join(health_lines)}]}
+    text = "\n".join(health_lines)
+
+    # Only a full scrape with no issues is safe to serve again without querying
+    if issues or not scrape_complete:
+        _healthy_until = 0.0
+        _healthy_response = None
+    else:
+        _healthy_until = time.monotonic() + HEALTHY_CACHE_SECONDS
+        _healthy_response = {"content": [{"type": "text", "text": f"{text} (cached)"}]}
+
+    return {"content": [{"type": "text", "text": text}]}
 
 
 async def get_logs(service: str, level: str = "all", lines: int = 20) -> dict[str, Any]:
@@ -1571,6 +1693,257 @@ async def execute_runbook(runbook: str, phase: str) -> dict[str, Any]:
 # ============================================================================
 
 
+class TokenBucket:
+    """Async token bucket that allows `rate` acquisitions per second on average.
+
+    The bucket holds at least one token so rates below 1/s can still be met.
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+_pd_rate_limiter = TokenBucket(PAGERDUTY_MAX_RPS)
+
+
+async def throttle_pd_request(request: httpx.Request) -> None:
+    """httpx request hook that holds each PagerDuty request until a token is free."""
+    await _pd_rate_limiter.acquire()
+
+
+# Default headers for every PagerDuty request, built once at import
+PAGERDUTY_HEADERS = {
+    "Authorization": f"Token token={PAGERDUTY_API_KEY}",
+    "Content-Type": "application/json",
+    "From": PAGERDUTY_FROM_EMAIL,
+}
+
+_pd_client: httpx.AsyncClient | None = None
+
+
+def get_pd_client() -> httpx.AsyncClient:
+    """Return the shared PagerDuty client, creating it on first use.
+
+    Reusing one client keeps connections to api.pagerduty.com alive between
+    tool calls instead of paying a TCP + TLS handshake on every request.
+    """
+    global _pd_client
+    if _pd_client is None:
+        _pd_client = httpx.AsyncClient(
+            base_url=PAGERDUTY_BASE_URL,
+            headers=PAGERDUTY_HEADERS,
+            timeout=10.0,
+            # Limits go on the transport: httpx ignores client-level limits
+            # when a transport is supplied
+            transport=httpx.AsyncHTTPTransport(
+                # Multiplex concurrent calls over one connection when h2 is installed
+                http2=importlib.util.find_spec("h2") is not None,
+                retries=PAGERDUTY_MAX_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50,
+                    keepalive_expiry=PAGERDUTY_HTTPX_KEEPALIVE,
+                ),
+            ),
+            event_hooks={"request": [throttle_pd_request]},
+        )
+    return _pd_client
+
+
+async def pd_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a PagerDuty request, retrying rate limits and transient server errors.
+
+    429 responses are retried for every method; 5xx responses only for GET and
+    PUT, so a create that failed server-side can't open a duplicate incident.
+    Each wait honours Retry-After, falling back to exponential backoff, and is
+    capped at PAGERDUTY_MAX_RETRY_DELAY seconds. The final response is
+    returned without raising for its status.
+    """
+    client = get_pd_client()
+    for attempt in range(PAGERDUTY_MAX_RETRIES):
+        response = await client.request(method, url, **kwargs)
+        if not (
+            response.status_code == 429
+            or (response.status_code in (500, 502, 503, 504) and method in ("GET", "PUT"))
+        ):
+            return response
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = -1.0
+        # Missing, malformed, negative or NaN values all fall back to backoff
+        if not delay >= 0:
+            delay = 2**attempt
+        await asyncio.sleep(min(delay, PAGERDUTY_MAX_RETRY_DELAY))
+    return await client.request(method, url, **kwargs)
+
+
+async def pagerduty_shutdown() -> None:
+    """Close the shared PagerDuty client, draining its connection pool."""
+    global _pd_client
+    if _pd_client is not None:
+        await _pd_client.aclose()
+        _pd_client = None
+
+
+# Read cache: key -> (expires_at, value). Entries are kept past expiry so they
+# can be served if PagerDuty errors; writes clear the whole cache.
+_pd_cache: dict[tuple, tuple[float, Any]] = {}
+# Cache misses currently being fetched, so concurrent callers share one request
+_pd_inflight: dict[tuple, asyncio.Task] = {}
+# Bumped by every write, so reads that started before it can't repopulate the cache
+_pd_cache_generation = 0
+
+
+def pd_cache_invalidate() -> None:
+    """Forget cached reads and in-flight fetches after a PagerDuty write."""
+    global _pd_cache_generation
+    _pd_cache_generation += 1
+    _pd_cache.clear()
+    _pd_inflight.clear()
+
+
+async def pd_get_cached(
+    key: tuple, path: str, field: str, params: dict[str, Any] | None = None
+) -> tuple[Any, bool]:
+    """GET a PagerDuty resource through the read cache.
+
+    Returns the response's `field` and whether it was served from the cache.
+    Concurrent misses for the same key wait on a single request; only the
+    caller that started it reports a miss. If the request fails and an
+    expired entry exists, that entry is returned instead of raising
+    (stale-if-error).
+    """
+    entry = _pd_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1], True
+
+    task = _pd_inflight.get(key)
+    joined = task is not None
+    if not joined:
+        task = asyncio.create_task(pd_fetch(key, path, field, params))
+        _pd_inflight[key] = task
+
+        def forget(done: asyncio.Task) -> None:
+            # A write may already have replaced this fetch with a newer one
+            if _pd_inflight.get(key) is done:
+                del _pd_inflight[key]
+
+        task.add_done_callback(forget)
+
+    try:
+        # Shielded so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task), joined
+    except httpx.HTTPError as e:
+        if entry is None:
+            raise
+        print(f"PagerDuty request failed, serving cached data: {e}", file=sys.stderr)
+        return entry[1], True
+
+
+async def pd_fetch(
+    key: tuple, path: str, field: str, params: dict[str, Any] | None
+) -> Any:
+    """GET PagerDuty incident(s) and store the slimmed `field` in the read cache."""
+    generation = _pd_cache_generation
+    response = await pd_request("GET", path, params=params)
+    response.raise_for_status()
+    value = json_loads(response.content)[field]
+    if isinstance(value, list):
+        value = [slim_incident(incident) for incident in value]
+    else:
+        value = slim_incident(value)
+    pd_cache_store(key, value, generation)
+    return value
+
+
+def slim_incident(incident: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the incident fields the tools render.
+
+    Full incident objects carry teams, priorities, escalation policies and
+    more; dropping them keeps cached entries small and lets the parsed
+    payload be freed right away.
+    """
+    return {
+        "id": incident["id"],
+        "title": incident["title"],
+        "status": incident["status"],
+        "urgency": incident["urgency"],
+        "created_at": incident["created_at"],
+        "html_url": incident["html_url"],
+        "service": {"summary": incident["service"]["summary"]},
+        "assignments": [
+            {"assignee": {"summary": a["assignee"]["summary"]}}
+            for a in incident.get("assignments") or ()
+        ],
+    }
+
+
+def pd_cache_store(key: tuple, value: Any, generation: int) -> None:
+    """Store a value in the read cache, evicting the oldest entry when full.
+
+    `generation` is the cache generation the value was read under; values read
+    before the latest write are dropped rather than cached.
+    """
+    if generation != _pd_cache_generation:
+        return
+    _pd_cache.pop(key, None)
+    if len(_pd_cache) >= PAGERDUTY_CACHE_MAX_ENTRIES:
+        _pd_cache.pop(next(iter(_pd_cache)))
+    _pd_cache[key] = (time.monotonic() + PAGERDUTY_CACHE_TTL, value)
+
+
+def pd_error_response(action: str, e: Exception) -> dict[str, Any]:
+    """Build the error result for a failed PagerDuty tool call."""
+    if isinstance(e, httpx.HTTPStatusError):
+        text = f"PagerDuty API error: {e.response.status_code} - {e.response.text}"
+    else:
+        text = f"Error {action}: {e}"
+    return {"content": [{"type": "text", "text": text}], "isError": True}
+
+
+async def post_pd_incident(
+    title: str, description: str, urgency: str, service_id: str
+) -> dict[str, Any]:
+    """POST a new incident to PagerDuty and return the created incident."""
+    response = await pd_request(
+        "POST",
+        "/incidents",
+        content=json_dumps(
+            {
+                "incident": {
+                    "type": "incident",
+                    "title": title,
+                    "service": {"id": service_id, "type": "service_reference"},
+                    "urgency": urgency,
+                    "body": {"type": "incident_body", "details": description},
+                }
+            }
+        ),
+    )
+    response.raise_for_status()
+    pd_cache_invalidate()
+    return json_loads(response.content)["incident"]
+
+
 async def pagerduty_create_incident(
     title: str, description: str, urgency: str = "high", service_id: str | None = None
 ) -> dict[str, Any]:
@@ -1603,60 +1976,91 @@ async def pagerduty_create_incident(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{PAGERDUTY_BASE_URL}/incidents",
-                headers={
-                    "Authorization": f"Token token={PAGERDUTY_API_KEY}",
-                    "Content-Type": "application/json",
-                    "From": PAGERDUTY_FROM_EMAIL or "sre-bot@example.com",
-                },
-                json={
-                    "incident": {
-                        "type": "incident",
-                        "title": title,
-                        "service": {"id": service, "type": "service_reference"},
-                        "urgency": urgency,
-                        "body": {"type": "incident_body", "details": description},
-                    }
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            incident = response.json()["incident"]
+        incident = await post_pd_incident(title, description, urgency, service)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Created PagerDuty incident:\n"
-                        f"  ID: {incident['id']}\n"
-                        f"  URL: {incident['html_url']}\n"
-                        f"  Status: {incident['status']}\n"
-                        f"  Urgency: {incident['urgency']}",
-                    }
-                ]
-            }
-    except httpx.HTTPStatusError as e:
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": (
-                        "PagerDuty API error: "
-                        f"{e.response.status_code}"
-                        f" - {e.response.text}"
+                    "text": "\n".join(
+                        [
+                            "Created PagerDuty incident:",
+                            f"  ID: {incident['id']}",
+                            f"  URL: {incident['html_url']}",
+                            f"  Status: {incident['status']}",
+                            f"  Urgency: {incident['urgency']}",
+                        ]
                     ),
                 }
-            ],
-            "isError": True,
+            ]
         }
     except Exception as e:
+        return pd_error_response("creating incident", e)
+
+
+async def pagerduty_create_incidents_bulk(
+    incidents: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Create several PagerDuty incidents concurrently."""
+    if not PAGERDUTY_API_KEY:
+        return {
+            "content": [{"type": "text", "text": "PagerDuty not configured"}],
+            "isError": True,
+        }
+
+    if not incidents or not isinstance(incidents, list):
         return {
-            "content": [{"type": "text", "text": f"Error creating incident: {str(e)}"}],
+            "content": [{"type": "text", "text": "No incidents provided"}],
             "isError": True,
         }
 
+    # Bound in-flight requests to stay well clear of PagerDuty's rate limit
+    semaphore = asyncio.Semaphore(PAGERDUTY_BULK_CONCURRENCY)
+
+    async def create_one(item: dict[str, Any]) -> dict[str, Any]:
+        if not isinstance(item, dict):
+            raise ValueError("incident must be an object")
+        service = item.get("service_id") or PAGERDUTY_SERVICE_ID
+        if not service:
+            raise ValueError("no service ID provided and PAGERDUTY_SERVICE_ID not set")
+        async with semaphore:
+            return await post_pd_incident(
+                item.get("title", ""),
+                item.get("description", ""),
+                item.get("urgency", "high"),
+                service,
+            )
+
+    results = await asyncio.gather(
+        *(create_one(item) for item in incidents), return_exceptions=True
+    )
+
+    failed = 0
+    result_lines = []
+    for item, result in zip(incidents, results, strict=True):
+        title = item.get("title", "") if isinstance(item, dict) else repr(item)
+        if isinstance(result, httpx.HTTPStatusError):
+            failed += 1
+            result_lines.append(
+                f"  [FAILED] {title}: PagerDuty API error:"
+                f" {result.response.status_code} - {result.response.text}"
+            )
+        elif isinstance(result, Exception):
+            failed += 1
+            result_lines.append(f"  [FAILED] {title}: {result}")
+        else:
+            result_lines.append(f"  {result['id']}: {title}")
+            result_lines.append(f"    URL: {result['html_url']}")
+
+    lines = [
+        f"Created {len(incidents) - failed}/{len(incidents)} PagerDuty incidents:",
+        *result_lines,
+    ]
+    return {
+        "content": [{"type": "text", "text": "\n".join(lines)}],
+        "isError": failed > 0,
+    }
+
 
 async def pagerduty_update_incident(
     incident_id: str, status: str, resolution_note: str | None = None
@@ -1669,66 +2073,55 @@ async def pagerduty_update_incident(
         }
 
     try:
-        headers = {
-            "Authorization": f"Token token={PAGERDUTY_API_KEY}",
-            "Content-Type": "application/json",
-            "From": PAGERDUTY_FROM_EMAIL or "sre-bot@example.com",
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{PAGERDUTY_BASE_URL}/incidents/{incident_id}",
-                headers=headers,
-                json={
+        response = await pd_request(
+            "PUT",
+            f"/incidents/{incident_id}",
+            content=json_dumps(
+                {
                     "incident": {
                         "id": incident_id,
                         "type": "incident_reference",
                         "status": status,
                     }
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            incident = response.json()["incident"]
-
-            # Add resolution note if provided
-            if resolution_note and status == "resolved":
-                await client.post(
-                    f"{PAGERDUTY_BASE_URL}/incidents/{incident_id}/notes",
-                    headers=headers,
-                    json={"note": {"content": f"Resolution: {resolution_note}"}},
-                    timeout=10.0,
+                }
+            ),
+        )
+        pd_cache_invalidate()
+        response.raise_for_status()
+        incident = json_loads(response.content)["incident"]
+
+        lines = [
+            f"Updated incident {incident_id}:",
+            f"  Status: {incident['status']}",
+            f"  URL: {incident['html_url']}",
+        ]
+
+        # Add resolution note if provided. It is only sent once the status change
+        # has succeeded, so a rejected update can't leave a stray note behind; a
+        # failed note is reported alongside the completed update
+        note_error = None
+        if resolution_note and status == "resolved":
+            try:
+                note = await pd_request(
+                    "POST",
+                    f"/incidents/{incident_id}/notes",
+                    content=json_dumps(
+                        {"note": {"content": f"Resolution: {resolution_note}"}}
+                    ),
                 )
+                if note.is_error:
+                    note_error = f"PagerDuty API error: {note.status_code} - {note.text}"
+            except httpx.HTTPError as e:
+                note_error = str(e)
+        if note_error:
+            lines.append(f"  Resolution note NOT added: {note_error}")
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Updated incident {incident_id}:\n"
-                        f"  Status: {incident['status']}\n"
-                        f"  URL: {incident['html_url']}",
-                    }
-                ]
-            }
-    except httpx.HTTPStatusError as e:
         return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": (
-                        "PagerDuty API error: "
-                        f"{e.response.status_code}"
-                        f" - {e.response.text}"
-                    ),
-                }
-            ],
-            "isError": True,
+            "content": [{"type": "text", "text": "\n".join(lines)}],
+            "isError": note_error is not None,
         }
     except Exception as e:
-        return {
-            "content": [{"type": "text", "text": f"Error updating incident: {str(e)}"}],
-            "isError": True,
-        }
+        return pd_error_response("updating incident", e)
 
 
 async def pagerduty_get_incident(incident_id: str) -> dict[str, Any]:
@@ -1740,55 +2133,40 @@ async def pagerduty_get_incident(incident_id: str) -> dict[str, Any]:
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{PAGERDUTY_BASE_URL}/incidents/{incident_id}",
-                headers={"Authorization": f"Token token={PAGERDUTY_API_KEY}"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            incident = response.json()["incident"]
-
-            lines = [
-                f"=== PagerDuty Incident {incident_id} ===",
-                f"Title: {incident['title']}",
-                f"Status: {incident['status']}",
-                f"Urgency: {incident['urgency']}",
-                f"Created: {incident['created_at']}",
-                f"Service: {incident['service']['summary']}",
-                f"URL: {incident['html_url']}",
-            ]
+        incident, _ = await pd_get_cached(
+            ("incident", incident_id), f"/incidents/{incident_id}", "incident"
+        )
 
-            if incident.get("assignments"):
-                assignees = [a["assignee"]["summary"] for a in incident["assignments"]]
-                lines.append(f"Assigned to: {', '.join(assignees)}")
+        text = (
+            f"=== PagerDuty Incident {incident_id} ===\n"
+            f"Title: {incident['title']}\n"
+            f"Status: {incident['status']}\n"
+            f"Urgency: {incident['urgency']}\n"
+            f"Created: {incident['created_at']}\n"
+            f"Service: {incident['service']['summary']}\n"
+            f"URL: {incident['html_url']}"
+        )
 
-            return {"content": [{"type": "text", "text": "\n".join(lines)}]}
-    except httpx.HTTPStatusError as e:
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": (
-                        "PagerDuty API error: "
-                        f"{e.response.status_code}"
-                        f" - {e.response.text}"
-                    ),
-                }
-            ],
-            "isError": True,
-        }
+        if incident.get("assignments"):
+            assignees = ", ".join(a["assignee"]["summary"] for a in incident["assignments"])
+            text += f"\nAssigned to: {assignees}"
+
+        return {"content": [{"type": "text", "text": text}]}
     except Exception as e:
-        return {
-            "content": [{"type": "text", "text": f"Error fetching incident: {str(e)}"}],
-            "isError": True,
-        }
+        return pd_error_response("fetching incident", e)
+
+
+PAGERDUTY_STATUS_LABELS = {
+    "triggered": "[TRIG]",
+    "acknowledged": "[ACK]",
+    "resolved": "[DONE]",
+}
 
 
 async def pagerduty_list_incidents(
-    status: str = "all", service_id: str | None = None
+    status: str = "all", service_id: str | None = None, max_pages: int = 1
 ) -> dict[str, Any]:
-    """List PagerDuty incidents."""
+    """List PagerDuty incidents, following up to `max_pages` pages of results."""
     if not PAGERDUTY_API_KEY:
         return {
             "content": [{"type": "text", "text": "PagerDuty not configured"}],
@@ -1796,7 +2174,9 @@ async def pagerduty_list_incidents(
         }
 
     try:
-        params = {"limit": 25}
+        page_size = 25
+        # No include[] expansions, and no total count (an extra query server-side)
+        params = {"limit": page_size, "total": "false"}
         if status == "all":
             params["statuses[]"] = ["triggered", "acknowledged"]
         else:
@@ -1804,55 +2184,40 @@ async def pagerduty_list_incidents(
         if service_id:
             params["service_ids[]"] = [service_id]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{PAGERDUTY_BASE_URL}/incidents",
-                headers={"Authorization": f"Token token={PAGERDUTY_API_KEY}"},
-                params=params,
-                timeout=10.0,
+        incidents = []
+        for page in range(min(max(1, int(max_pages)), PAGERDUTY_LIST_MAX_PAGES)):
+            offset = page * page_size
+            generation = _pd_cache_generation
+            page_incidents, cached = await pd_get_cached(
+                ("incidents", status, service_id, offset),
+                "/incidents",
+                "incidents",
+                {**params, "offset": offset},
             )
-            response.raise_for_status()
-            incidents = response.json()["incidents"]
+            if page == 0 and not cached:
+                # List entries are slimmed to the same shape get_incident caches,
+                # so the usual follow-up on one of them needs no request
+                for inc in page_incidents[:PAGERDUTY_PREFETCH_COUNT]:
+                    pd_cache_store(("incident", inc["id"]), inc, generation)
+            incidents.extend(page_incidents)
+            # A short page is the last one
+            if len(page_incidents) < page_size:
+                break
 
-            if not incidents:
-                return {
-                    "content": [{"type": "text", "text": "No active incidents found."}]
-                }
+        if not incidents:
+            return {"content": [{"type": "text", "text": "No active incidents found."}]}
 
-            lines = [f"=== Active PagerDuty Incidents ({len(incidents)}) ===", ""]
-            for inc in incidents:
-                status_emoji = {
-                    "triggered": "[TRIG]",
-                    "acknowledged": "[ACK]",
-                    "resolved": "[DONE]",
-                }
-                lines.append(f"{status_emoji.get(inc['status'], '[?]')} {inc['title']}")
-                lines.append(
-                    f"    ID: {inc['id']} | Service: {inc['service']['summary']}"
-                )
-                lines.append(f"    Created: {inc['created_at']}")
-                lines.append("")
+        body = "\n".join(
+            f"{PAGERDUTY_STATUS_LABELS.get(inc['status'], '[?]')} {inc['title']}\n"
+            f"    ID: {inc['id']} | Service: {inc['service']['summary']}\n"
+            f"    Created: {inc['created_at']}\n"
+            for inc in incidents
+        )
+        text = f"=== Active PagerDuty Incidents ({len(incidents)}) ===\n\n{body}"
 
-            return {"content": [{"type": "text", "text": "\n".join(lines)}]}
-    except httpx.HTTPStatusError as e:
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": (
-                        "PagerDuty API error: "
-                        f"{e.response.status_code}"
-                        f" - {e.response.text}"
-                    ),
-                }
-            ],
-            "isError": True,
-        }
+        return {"content": [{"type": "text", "text": text}]}
     except Exception as e:
-        return {
-            "content": [{"type": "text", "text": f"Error listing incidents: {str(e)}"}],
-            "isError": True,
-        }
+        return pd_error_response("listing incidents", e)
 
 
 # ============================================================================
@@ -1860,11 +2225,40 @@ async def pagerduty_list_incidents(
 # ============================================================================
 
 
-def get_confluence_auth_header() -> str:
-    """Generate Basic auth header for Confluence API."""
-    credentials = f"{CONFLUENCE_USER_EMAIL}:{CONFLUENCE_API_TOKEN}"
-    encoded = base64.b64encode(credentials.encode()).decode()
-    return f"Basic {encoded}"
+# CQL prefix matching post-mortem pages in the configured space
+CONFLUENCE_POSTMORTEM_CQL = f'space = "{CONFLUENCE_SPACE_KEY}" AND title ~ "Post-Mortem"'
+# Backslash-escapes quotes (and backslashes, so a trailing one can't escape the
+# closing quote) in a single pass
+CQL_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "'": "\\'"})
+
+# Basic auth header for Confluence API, encoded once from the static credentials
+CONFLUENCE_AUTH_HEADER = "Basic " + base64.b64encode(
+    f"{CONFLUENCE_USER_EMAIL}:{CONFLUENCE_API_TOKEN}".encode()
+).decode()
+
+
+_confluence_client: httpx.AsyncClient | None = None
+
+
+def get_confluence_client() -> httpx.AsyncClient:
+    """Return the shared Confluence client, creating it on first use."""
+    global _confluence_client
+    if _confluence_client is None:
+        _confluence_client = httpx.AsyncClient(
+            base_url=CONFLUENCE_BASE_URL or "",
+            headers={"Authorization": CONFLUENCE_AUTH_HEADER},
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _confluence_client
+
+
+async def confluence_shutdown() -> None:
+    """Close the shared Confluence client, draining its connection pool."""
+    global _confluence_client
+    if _confluence_client is not None:
+        await _confluence_client.aclose()
+        _confluence_client = None
 
 
 def generate_postmortem_content(
@@ -1900,27 +2294,22 @@ def generate_postmortem_content(
         remediation_html = "<p><em>Remediation steps to be added</em></p>"
 
     # Build action items table
-    action_items_html = """
-    <table>
-        <thead><tr><th>Task</th><th>Owner</th>
-        <th>Due Date</th><th>Status</th></tr></thead>
-        <tbody>
-    """
+    rows = [
+        "<table><thead><tr><th>Task</th><th>Owner</th>"
+        "<th>Due Date</th><th>Status</th></tr></thead><tbody>"
+    ]
     if action_items:
-        for item in action_items:
-            action_items_html += f"""
-            <tr>
-                <td>{esc(item.get("task", "TBD"))}</td>
-                <td>{esc(item.get("owner", "TBD"))}</td>
-                <td>{esc(item.get("due_date", "TBD"))}</td>
-                <td>Open</td>
-            </tr>
-            """
-    else:
-        action_items_html += (
-            "<tr><td colspan='4'><em>Action items to be added</em></td></tr>"
+        rows.extend(
+            f"<tr><td>{esc(item.get('task', 'TBD'))}</td>"
+            f"<td>{esc(item.get('owner', 'TBD'))}</td>"
+            f"<td>{esc(item.get('due_date', 'TBD'))}</td>"
+            "<td>Open</td></tr>"
+            for item in action_items
         )
-    action_items_html += "</tbody></table>"
+    else:
+        rows.append("<tr><td colspan='4'><em>Action items to be added</em></td></tr>")
+    rows.append("</tbody></table>")
+    action_items_html = "".join(rows)
 
     # PagerDuty link if provided
     pd_link = ""
@@ -2002,32 +2391,25 @@ async def confluence_create_postmortem(
         page_data["ancestors"] = [{"id": CONFLUENCE_PARENT_PAGE_ID}]
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{CONFLUENCE_BASE_URL}/rest/api/content",
-                headers={
-                    "Authorization": get_confluence_auth_header(),
-                    "Content-Type": "application/json",
-                },
-                json=page_data,
-                timeout=15.0,
-            )
-            response.raise_for_status()
-            page = response.json()
+        response = await get_confluence_client().post(
+            "/rest/api/content", json=page_data, timeout=15.0
+        )
+        response.raise_for_status()
+        page = response.json()
 
-            page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
+        page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Created post-mortem page:\n"
-                        f"  Title: {page['title']}\n"
-                        f"  ID: {page['id']}\n"
-                        f"  URL: {page_url}",
-                    }
-                ]
-            }
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Created post-mortem page:\n"
+                    f"  Title: {page['title']}\n"
+                    f"  ID: {page['id']}\n"
+                    f"  URL: {page_url}",
+                }
+            ]
+        }
     except httpx.HTTPStatusError as e:
         return {
             "content": [
@@ -2068,57 +2450,53 @@ async def confluence_get_page(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            if page_id:
-                response = await client.get(
-                    f"{CONFLUENCE_BASE_URL}/rest/api/content/{page_id}",
-                    headers={"Authorization": get_confluence_auth_header()},
-                    params={"expand": "body.storage,version"},
-                    timeout=10.0,
-                )
-            else:
-                response = await client.get(
-                    f"{CONFLUENCE_BASE_URL}/rest/api/content",
-                    headers={"Authorization": get_confluence_auth_header()},
-                    params={
-                        "title": title,
-                        "spaceKey": CONFLUENCE_SPACE_KEY,
-                        "expand": "body.storage,version",
-                    },
-                    timeout=10.0,
-                )
+        client = get_confluence_client()
+        if page_id:
+            response = await client.get(
+                f"/rest/api/content/{page_id}",
+                params={"expand": "body.storage,version"},
+            )
+        else:
+            response = await client.get(
+                "/rest/api/content",
+                params={
+                    "title": title,
+                    "spaceKey": CONFLUENCE_SPACE_KEY,
+                    "expand": "body.storage,version",
+                },
+            )
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
-            if "results" in data:
-                if not data["results"]:
-                    return {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"No page found with title: {title}",
-                            }
-                        ]
-                    }
-                page = data["results"][0]
-            else:
-                page = data
+        if "results" in data:
+            if not data["results"]:
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"No page found with title: {title}",
+                        }
+                    ]
+                }
+            page = data["results"][0]
+        else:
+            page = data
 
-            page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
+        page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"=== Confluence Page ===\n"
-                        f"Title: {page['title']}\n"
-                        f"ID: {page['id']}\n"
-                        f"Version: {page['version']['number']}\n"
-                        f"URL: {page_url}",
-                    }
-                ]
-            }
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"=== Confluence Page ===\n"
+                    f"Title: {page['title']}\n"
+                    f"ID: {page['id']}\n"
+                    f"Version: {page['version']['number']}\n"
+                    f"URL: {page_url}",
+                }
+            ]
+        }
     except httpx.HTTPStatusError as e:
         return {
             "content": [
@@ -2152,39 +2530,34 @@ async def confluence_list_postmortems(
 
     try:
         # Use CQL (Confluence Query Language) to search
-        cql = f'space = "{CONFLUENCE_SPACE_KEY}" AND title ~ "Post-Mortem"'
-        cql += f' AND created >= now("-{days}d")'
+        text_clause = ""
         if search_term:
-            sanitized = search_term.replace('"', '\\"').replace("'", "\\'")
-            cql += f' AND text ~ "{sanitized}"'
+            sanitized = search_term.translate(CQL_ESCAPE_TABLE)
+            text_clause = f' AND text ~ "{sanitized}"'
+        cql = f'{CONFLUENCE_POSTMORTEM_CQL} AND created >= now("-{days}d"){text_clause}'
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{CONFLUENCE_BASE_URL}/rest/api/content/search",
-                headers={"Authorization": get_confluence_auth_header()},
-                params={"cql": cql, "limit": 20, "expand": "version"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            results = response.json().get("results", [])
+        response = await get_confluence_client().get(
+            "/rest/api/content/search",
+            params={"cql": cql, "limit": 20, "expand": "version"},
+        )
+        response.raise_for_status()
+        results = response.json().get("results", [])
 
-            if not results:
-                return {
-                    "content": [{"type": "text", "text": "No post-mortem pages found."}]
-                }
+        if not results:
+            return {"content": [{"type": "text", "text": "No post-mortem pages found."}]}
 
-            lines = [f"=== Recent Post-Mortems ({len(results)}) ===", ""]
-            for page in results:
-                page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
-                lines.append(f"- {page['title']}")
-                lines.append(
-                    f"  ID: {page['id']}"
-                    f" | Last modified: {page['version']['when'][:10]}"
-                )
-                lines.append(f"  URL: {page_url}")
-                lines.append("")
+        lines = [f"=== Recent Post-Mortems ({len(results)}) ===", ""]
+        for page in results:
+            page_url = f"{CONFLUENCE_BASE_URL}{page['_links']['webui']}"
+            lines.append(f"- {page['title']}")
+            lines.append(
+                f"  ID: {page['id']}"
+                f" | Last modified: {page['version']['when'][:10]}"
+            )
+            lines.append(f"  URL: {page_url}")
+            lines.append("")
 
-            return {"content": [{"type": "text", "text": "\n".join(lines)}]}
+        return {"content": [{"type": "text", "text": "\n".join(lines)}]}
     except httpx.HTTPStatusError as e:
         return {
             "content": [
@@ -2216,8 +2589,7 @@ async def read_config_file(path: str) -> dict[str, Any]:
     try:
         # Security: Only allow reading from config directory
         full_path = (PROJECT_ROOT / path).resolve()
-        allowed_root = (PROJECT_ROOT / "config").resolve()
-        if not full_path.is_relative_to(allowed_root):
+        if not full_path.is_relative_to(CONFIG_ROOT):
             return {
                 "content": [
                     {
@@ -2232,15 +2604,15 @@ async def read_config_file(path: str) -> dict[str, Any]:
                 "isError": True,
             }
 
-        if not full_path.exists():
+        try:
+            # File I/O runs in a worker thread so the event loop stays free
+            content = await asyncio.to_thread(full_path.read_text)
+        except FileNotFoundError:
             return {
                 "content": [{"type": "text", "text": f"File not found: {path}"}],
                 "isError": True,
             }
 
-        with open(full_path, "r") as f:
-            content = f.read()
-
         return {"content": [{"type": "text", "text": f"=== {path} ===\n\n{content}"}]}
     except Exception as e:
         return {
@@ -2249,13 +2621,16 @@ async def read_config_file(path: str) -> dict[str, Any]:
         }
 
 
+# Serializes edit_config_file's read-modify-write cycles
+_config_edit_lock = asyncio.Lock()
+
+
 async def edit_config_file(path: str, old_value: str, new_value: str) -> dict[str, Any]:
     """Edit a configuration file by replacing a value."""
     try:
         # Security: Only allow editing config directory
         full_path = (PROJECT_ROOT / path).resolve()
-        allowed_root = (PROJECT_ROOT / "config").resolve()
-        if not full_path.is_relative_to(allowed_root):
+        if not full_path.is_relative_to(CONFIG_ROOT):
             return {
                 "content": [
                     {
@@ -2270,34 +2645,36 @@ async def edit_config_file(path: str, old_value: str, new_value: str) -> dict[st
                 "isError": True,
             }
 
-        if not full_path.exists():
-            return {
-                "content": [{"type": "text", "text": f"File not found: {path}"}],
-                "isError": True,
-            }
-
-        with open(full_path, "r") as f:
-            content = f.read()
+        # Held across read, replace and write so concurrent edits can't
+        # overwrite each other with stale content
+        async with _config_edit_lock:
+            try:
+                # File I/O runs in a worker thread so the event loop stays free
+                content = await asyncio.to_thread(full_path.read_text)
+            except FileNotFoundError:
+                return {
+                    "content": [{"type": "text", "text": f"File not found: {path}"}],
+                    "isError": True,
+                }
 
-        if old_value not in content:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": (
-                            f"Error: Could not find"
-                            f" '{old_value}' in {path}."
-                            f"\n\nCurrent content:\n{content}"
-                        ),
-                    }
-                ],
-                "isError": True,
-            }
+            if old_value not in content:
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": (
+                                f"Error: Could not find"
+                                f" '{old_value}' in {path}."
+                                f"\n\nCurrent content:\n{content}"
+                            ),
+                        }
+                    ],
+                    "isError": True,
+                }
 
-        new_content = content.replace(old_value, new_value, 1)
+            new_content = content.replace(old_value, new_value, 1)
 
-        with open(full_path, "w") as f:
-            f.write(new_content)
+            await asyncio.to_thread(full_path.write_text, new_content)
 
         return {
             "content": [
@@ -2318,19 +2695,109 @@ async def edit_config_file(path: str, old_value: str, new_value: str) -> dict[st
         }
 
 
+# Security: allowlist of executables and subcommands for run_shell_command.
+# "docker-compose" is a single binary; "docker compose/ps/logs" are
+# subcommands of the "docker" binary.
+ALLOWED_COMMANDS: dict[str, frozenset[str]] = {
+    "docker-compose": frozenset({"up", "down", "ps", "logs", "restart", "build"}),
+    "docker": frozenset({"compose", "ps", "logs"}),
+}
+ALLOWED_SUBCOMMANDS_TEXT = {exe: ", ".join(sorted(subs)) for exe, subs in ALLOWED_COMMANDS.items()}
+
+# Quoting and expansion characters rejected in run_shell_command
+COMMAND_SPECIAL_CHARS = frozenset("\"'`$\\")
+
+# Containers get_container_logs may read
+VALID_CONTAINERS = frozenset(
+    {"api-server", "postgres", "traffic-generator", "prometheus", "grafana"}
+)
+VALID_CONTAINERS_TEXT = "api-server, postgres, traffic-generator, prometheus, grafana"
+
+# Most subprocess output (per stream) returned to the model; the tail is kept
+MAX_COMMAND_OUTPUT_BYTES = 256 * 1024
+
+
+async def read_output_tail(stream: asyncio.StreamReader) -> str:
+    """Read a subprocess stream to EOF and decode its last MAX_COMMAND_OUTPUT_BYTES.
+
+    Earlier chunks are dropped as they arrive, so memory stays bounded no
+    matter how much the process writes.
+    """
+    chunks: deque[bytes] = deque()
+    kept = total = 0
+    while chunk := await stream.read(64 * 1024):
+        chunks.append(chunk)
+        kept += len(chunk)
+        total += len(chunk)
+        while kept - len(chunks[0]) >= MAX_COMMAND_OUTPUT_BYTES:
+            kept -= len(chunks.popleft())
+
+    data = b"".join(chunks)[-MAX_COMMAND_OUTPUT_BYTES:]
+    text = data.decode("utf-8", errors="replace")
+    if total > len(data):
+        return f"[... {total - len(data)} bytes truncated ...]\n{text}"
+    return text
+
+
+async def run_command(args: list[str], timeout: float) -> tuple[int, str, str]:
+    """Run a command in the project directory; return (exit code, stdout, stderr).
+
+    Both streams are drained concurrently so neither pipe can fill and stall
+    the process. On timeout the process and everything it spawned are killed
+    and TimeoutError raised.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=PROJECT_ROOT,
+        # Own process group, so a timeout can kill children like the compose plugin
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr, returncode = await asyncio.wait_for(
+            asyncio.gather(
+                read_output_tail(process.stdout),
+                read_output_tail(process.stderr),
+                process.wait(),
+            ),
+            timeout=timeout,
+        )
+    except TimeoutError:
+        # Killing only the direct child would leave its descendants holding the
+        # pipes open, and wait() doesn't return until the pipes close
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        try:
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except TimeoutError:
+            # Something escaped the group and still holds a pipe; stop waiting on it
+            pass
+        raise
+    return returncode, stdout, stderr
+
+
 async def run_shell_command(command: str) -> dict[str, Any]:
     """Run a shell command in the project directory."""
     try:
-        # Parse command into tokens safely (rejects unbalanced quotes)
-        try:
-            args = shlex.split(command)
-        except ValueError as e:
+        # Allowed commands never need quoting or expansion, so reject those
+        # characters outright and split on whitespace
+        if not COMMAND_SPECIAL_CHARS.isdisjoint(command):
             return {
                 "content": [
-                    {"type": "text", "text": f"Error: Invalid command syntax: {e}"}
+                    {
+                        "type": "text",
+                        "text": (
+                            "Error: Invalid command syntax:"
+                            " quotes, backticks, $ and \\ are not allowed"
+                        ),
+                    }
                 ],
                 "isError": True,
             }
+        args = command.split()
 
         if not args:
             return {
@@ -2338,16 +2805,9 @@ async def run_shell_command(command: str) -> dict[str, Any]:
                 "isError": True,
             }
 
-        # Security: Validate the executable and subcommand against an allowlist.
-        # "docker-compose" is a single binary; "docker compose/ps/logs" are
-        # subcommands of the "docker" binary.
-        allowed_commands = {
-            "docker-compose": {"up", "down", "ps", "logs", "restart", "build"},
-            "docker": {"compose", "ps", "logs"},
-        }
-
+        # Security: Validate the executable and subcommand against an allowlist
         executable = args[0]
-        if executable not in allowed_commands:
+        if executable not in ALLOWED_COMMANDS:
             return {
                 "content": [
                     {
@@ -2362,48 +2822,36 @@ async def run_shell_command(command: str) -> dict[str, Any]:
                 "isError": True,
             }
 
-        allowed_subs = allowed_commands[executable]
-        if allowed_subs is not None:
-            subcommand = args[1] if len(args) > 1 else ""
-            if subcommand not in allowed_subs:
-                return {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": (
-                                f"Error: '{executable}"
-                                f" {subcommand}' is not"
-                                " allowed. Allowed: "
-                                f"{', '.join(sorted(allowed_subs))}"
-                            ),
-                        }
-                    ],
-                    "isError": True,
-                }
+        subcommand = args[1] if len(args) > 1 else ""
+        if subcommand not in ALLOWED_COMMANDS[executable]:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": (
+                            f"Error: '{executable}"
+                            f" {subcommand}' is not"
+                            " allowed. Allowed: "
+                            f"{ALLOWED_SUBCOMMANDS_TEXT[executable]}"
+                        ),
+                    }
+                ],
+                "isError": True,
+            }
 
         # Run using exec (no shell) to prevent injection via metacharacters
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=PROJECT_ROOT,
-        )
-
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60.0)
-
-        output = stdout.decode("utf-8", errors="replace")
-        error = stderr.decode("utf-8", errors="replace")
+        returncode, output, error = await run_command(args, timeout=60.0)
 
-        result_text = f"$ {command}\n\n"
+        parts = [f"$ {command}\n\n"]
         if output:
-            result_text += f"STDOUT:\n{output}\n"
+            parts.append(f"STDOUT:\n{output}\n")
         if error:
-            result_text += f"STDERR:\n{error}\n"
-        result_text += f"\nExit code: {process.returncode}"
+            parts.append(f"STDERR:\n{error}\n")
+        parts.append(f"\nExit code: {returncode}")
 
         return {
-            "content": [{"type": "text", "text": result_text}],
-            "isError": process.returncode != 0,
+            "content": [{"type": "text", "text": "".join(parts)}],
+            "isError": returncode != 0,
         }
     except asyncio.TimeoutError:
         return {
@@ -2426,14 +2874,7 @@ async def get_container_logs(container: str, lines: int = 50) -> dict[str, Any]:
     """Get logs from a Docker container."""
     try:
         # Validate container name
-        valid_containers = [
-            "api-server",
-            "postgres",
-            "traffic-generator",
-            "prometheus",
-            "grafana",
-        ]
-        if container not in valid_containers:
+        if container not in VALID_CONTAINERS:
             return {
                 "content": [
                     {
@@ -2441,7 +2882,7 @@ async def get_container_logs(container: str, lines: int = 50) -> dict[str, Any]:
                         "text": (
                             f"Invalid container: {container}."
                             " Valid options: "
-                            f"{', '.join(valid_containers)}"
+                            f"{VALID_CONTAINERS_TEXT}"
                         ),
                     }
                 ],
@@ -2453,7 +2894,7 @@ async def get_container_logs(container: str, lines: int = 50) -> dict[str, Any]:
 
         # Get logs using docker-compose
         args = [
-            "docker-compose",
+            docker_compose_executable(),
             "-f",
             "config/docker-compose.yml",
             "logs",
@@ -2461,19 +2902,9 @@ async def get_container_logs(container: str, lines: int = 50) -> dict[str, Any]:
             f"--tail={lines}",
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=PROJECT_ROOT,
-        )
-
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30.0)
-
-        output = stdout.decode("utf-8", errors="replace")
-        error = stderr.decode("utf-8", errors="replace")
+        returncode, output, error = await run_command(args, timeout=30.0)
 
-        if process.returncode != 0:
+        if returncode != 0:
             return {
                 "content": [{"type": "text", "text": f"Error getting logs: {error}"}],
                 "isError": True,
@@ -2507,6 +2938,12 @@ async def get_container_logs(container: str, lines: int = 50) -> dict[str, Any]:
         }
 
 
+def write_file_creating_dir(path: Path, content: str) -> None:
+    """Write a file, creating its parent directory first; runs in a worker thread."""
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(content)
+
+
 async def write_postmortem(
     title: str,
     summary: str,
@@ -2518,14 +2955,14 @@ async def write_postmortem(
     """Write a post-mortem report to the postmortems/ directory."""
 
     postmortems_dir = PROJECT_ROOT / "postmortems"
-    postmortems_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     filename = f"postmortem_{timestamp}.md"
     filepath = postmortems_dir / filename
 
     content = f"# Post-Mortem: {title}\n\n"
-    content += f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    content += f"**Date**: {now:%Y-%m-%d %H:%M:%S}\n\n"
     content += f"## Summary\n\n{summary}\n\n"
     content += f"## Root Cause\n\n{root_cause}\n\n"
     if timeline:
@@ -2535,8 +2972,7 @@ async def write_postmortem(
     if action_items:
         content += f"## Action Items\n\n{action_items}\n\n"
 
-    with open(filepath, "w") as f:
-        f.write(content)
+    await asyncio.to_thread(write_file_creating_dir, filepath, content)
 
     return {
         "content": [{"type": "text", "text": f"Post-mortem written to {filename}"}],
@@ -2544,108 +2980,99 @@ async def write_postmortem(
     }
 
 
-async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-    """Route tool calls to the appropriate handler."""
-    if name == "query_metrics":
-        return await query_metrics(arguments.get("promql", ""))
-    elif name == "list_metrics":
-        return await list_metrics()
-    elif name == "get_service_health":
-        return await get_service_health()
-    elif name == "get_logs":
-        return await get_logs(
-            service=arguments.get("service", ""),
-            level=arguments.get("level", "all"),
-            lines=arguments.get("lines", 20),
-        )
-    elif name == "get_alerts":
-        return await get_alerts()
-    elif name == "get_recent_deployments":
-        return await get_recent_deployments(service=arguments.get("service"))
-    elif name == "execute_runbook":
-        return await execute_runbook(
-            runbook=arguments.get("runbook", ""),
-            phase=arguments.get("phase", "investigate"),
-        )
-    elif name == "write_postmortem":
-        return await write_postmortem(
-            title=arguments.get("title", ""),
-            summary=arguments.get("summary", ""),
-            root_cause=arguments.get("root_cause", ""),
-            timeline=arguments.get("timeline", ""),
-            remediation=arguments.get("remediation", ""),
-            action_items=arguments.get("action_items", ""),
-        )
+# Tool name -> adapter that maps the MCP arguments onto the handler's parameters
+TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+    "query_metrics": lambda args: query_metrics(args.get("promql", "")),
+    "list_metrics": lambda args: list_metrics(),
+    "get_service_health": lambda args: get_service_health(),
+    "get_logs": lambda args: get_logs(
+        service=args.get("service", ""),
+        level=args.get("level", "all"),
+        lines=args.get("lines", 20),
+    ),
+    "get_alerts": lambda args: get_alerts(),
+    "get_recent_deployments": lambda args: get_recent_deployments(service=args.get("service")),
+    "execute_runbook": lambda args: execute_runbook(
+        runbook=args.get("runbook", ""),
+        phase=args.get("phase", "investigate"),
+    ),
+    "write_postmortem": lambda args: write_postmortem(
+        title=args.get("title", ""),
+        summary=args.get("summary", ""),
+        root_cause=args.get("root_cause", ""),
+        timeline=args.get("timeline", ""),
+        remediation=args.get("remediation", ""),
+        action_items=args.get("action_items", ""),
+    ),
     # PagerDuty tools
-    elif name == "pagerduty_create_incident":
-        return await pagerduty_create_incident(
-            title=arguments.get("title", ""),
-            description=arguments.get("description", ""),
-            urgency=arguments.get("urgency", "high"),
-            service_id=arguments.get("service_id"),
-        )
-    elif name == "pagerduty_update_incident":
-        return await pagerduty_update_incident(
-            incident_id=arguments.get("incident_id", ""),
-            status=arguments.get("status", ""),
-            resolution_note=arguments.get("resolution_note"),
-        )
-    elif name == "pagerduty_get_incident":
-        return await pagerduty_get_incident(
-            incident_id=arguments.get("incident_id", "")
-        )
-    elif name == "pagerduty_list_incidents":
-        return await pagerduty_list_incidents(
-            status=arguments.get("status", "all"),
-            service_id=arguments.get("service_id"),
-        )
+    "pagerduty_create_incident": lambda args: pagerduty_create_incident(
+        title=args.get("title", ""),
+        description=args.get("description", ""),
+        urgency=args.get("urgency", "high"),
+        service_id=args.get("service_id"),
+    ),
+    "pagerduty_create_incidents_bulk": lambda args: pagerduty_create_incidents_bulk(
+        incidents=args.get("incidents", [])
+    ),
+    "pagerduty_update_incident": lambda args: pagerduty_update_incident(
+        incident_id=args.get("incident_id", ""),
+        status=args.get("status", ""),
+        resolution_note=args.get("resolution_note"),
+    ),
+    "pagerduty_get_incident": lambda args: pagerduty_get_incident(
+        incident_id=args.get("incident_id", "")
+    ),
+    "pagerduty_list_incidents": lambda args: pagerduty_list_incidents(
+        status=args.get("status", "all"),
+        service_id=args.get("service_id"),
+        max_pages=args.get("max_pages", 1),
+    ),
     # Confluence tools
-    elif name == "confluence_create_postmortem":
-        return await confluence_create_postmortem(
-            title=arguments.get("title", ""),
-            incident_summary=arguments.get("incident_summary", ""),
-            root_cause=arguments.get("root_cause", ""),
-            timeline=arguments.get("timeline"),
-            impact=arguments.get("impact"),
-            remediation_steps=arguments.get("remediation_steps"),
-            action_items=arguments.get("action_items"),
-            pagerduty_incident_id=arguments.get("pagerduty_incident_id"),
-        )
-    elif name == "confluence_get_page":
-        return await confluence_get_page(
-            page_id=arguments.get("page_id"), title=arguments.get("title")
-        )
-    elif name == "confluence_list_postmortems":
-        return await confluence_list_postmortems(
-            days=arguments.get("days", 30), search_term=arguments.get("search_term")
-        )
+    "confluence_create_postmortem": lambda args: confluence_create_postmortem(
+        title=args.get("title", ""),
+        incident_summary=args.get("incident_summary", ""),
+        root_cause=args.get("root_cause", ""),
+        timeline=args.get("timeline"),
+        impact=args.get("impact"),
+        remediation_steps=args.get("remediation_steps"),
+        action_items=args.get("action_items"),
+        pagerduty_incident_id=args.get("pagerduty_incident_id"),
+    ),
+    "confluence_get_page": lambda args: confluence_get_page(
+        page_id=args.get("page_id"), title=args.get("title")
+    ),
+    "confluence_list_postmortems": lambda args: confluence_list_postmortems(
+        days=args.get("days", 30), search_term=args.get("search_term")
+    ),
     # Config and infrastructure tools
-    elif name == "read_config_file":
-        return await read_config_file(path=arguments.get("path", ""))
-    elif name == "edit_config_file":
-        return await edit_config_file(
-            path=arguments.get("path", ""),
-            old_value=arguments.get("old_value", ""),
-            new_value=arguments.get("new_value", ""),
-        )
-    elif name == "run_shell_command":
-        return await run_shell_command(command=arguments.get("command", ""))
-    elif name == "get_container_logs":
-        return await get_container_logs(
-            container=arguments.get("container", ""), lines=arguments.get("lines", 50)
-        )
-    else:
+    "read_config_file": lambda args: read_config_file(path=args.get("path", "")),
+    "edit_config_file": lambda args: edit_config_file(
+        path=args.get("path", ""),
+        old_value=args.get("old_value", ""),
+        new_value=args.get("new_value", ""),
+    ),
+    "run_shell_command": lambda args: run_shell_command(command=args.get("command", "")),
+    "get_container_logs": lambda args: get_container_logs(
+        container=args.get("container", ""), lines=args.get("lines", 50)
+    ),
+}
+
+
+async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Route tool calls to the appropriate handler."""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         return {
             "content": [{"type": "text", "text": f"Unknown tool: {name}"}],
             "isError": True,
         }
+    return await handler(arguments)
 
 
 def send_response(response: dict[str, Any]) -> None:
     """Send a JSON-RPC response to stdout."""
-    json_str = json.dumps(response)
-    sys.stdout.write(json_str + "\n")
-    sys.stdout.flush()
+    sys.stdout.buffer.write(json_dumps(response) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def send_error(id: Any, code: int, message: str) -> None:
@@ -2655,6 +3082,15 @@ def send_error(id: Any, code: int, message: str) -> None:
     )
 
 
+# Static results for the initialize and tools/list methods
+INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {"tools": {}},
+    "serverInfo": {"name": "sre-tools", "version": "1.0.0"},
+}
+TOOLS_LIST_RESULT = {"tools": TOOLS}
+
+
 async def handle_request(request: dict[str, Any]) -> None:
     """Handle an incoming JSON-RPC request."""
     method = request.get("method", "")
@@ -2663,22 +3099,12 @@ async def handle_request(request: dict[str, Any]) -> None:
 
     if method == "initialize":
         # MCP initialization
-        send_response(
-            {
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {"tools": {}},
-                    "serverInfo": {"name": "sre-tools", "version": "1.0.0"},
-                },
-            }
-        )
+        send_response({"jsonrpc": "2.0", "id": req_id, "result": INITIALIZE_RESULT})
     elif method == "notifications/initialized":
         # No response needed for notifications
         pass
     elif method == "tools/list":
-        send_response({"jsonrpc": "2.0", "id": req_id, "result": {"tools": TOOLS}})
+        send_response({"jsonrpc": "2.0", "id": req_id, "result": TOOLS_LIST_RESULT})
     elif method == "tools/call":
         tool_name = params.get("name", "")
         arguments = params.get("arguments", {})
@@ -2688,6 +3114,17 @@ async def handle_request(request: dict[str, Any]) -> None:
         send_error(req_id, -32601, f"Method not found: {method}")
 
 
+async def handle_request_logged(request: dict[str, Any]) -> None:
+    """Handle a request as a background task, reporting failures instead of raising."""
+    try:
+        await handle_request(request)
+    except Exception as e:
+        # Log to stderr so it doesn't interfere with JSON-RPC
+        print(f"Error handling {request.get('method')}: {e}", file=sys.stderr)
+        if request.get("id") is not None:
+            send_error(request["id"], -32603, f"Internal error: {e}")
+
+
 async def main():
     """Main event loop - read JSON-RPC requests from stdin."""
     # Disable buffering for stdin
@@ -2696,27 +3133,75 @@ async def main():
     protocol = asyncio.StreamReaderProtocol(reader)
     await loop.connect_read_pipe(lambda: protocol, sys.stdin)
 
-    while True:
-        try:
-            line = await reader.readline()
-            if not line:
-                break
+    # Resolve docker-compose up front so the first get_logs call doesn't pay for it
+    docker_compose_executable()
 
-            line = line.decode("utf-8").strip()
-            if not line:
-                continue
+    # Requests run as tasks so a slow tool call doesn't hold up the ones behind
+    # it. send_response writes each message in one synchronous call, so
+    # responses can't interleave on stdout.
+    tasks: set[asyncio.Task] = set()
 
+    try:
+        while True:
             try:
-                request = json.loads(line)
-                await handle_request(request)
-            except json.JSONDecodeError as e:
-                send_error(None, -32700, f"Parse error: {e}")
+                line = await reader.readline()
+                if not line:
+                    break
+
+                # json_loads takes bytes, so the line is never decoded to str
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    request = json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    send_error(None, -32700, f"Parse error: {e}")
+                    continue
+                if not isinstance(request, dict):
+                    send_error(None, -32600, "Invalid Request")
+                    continue
+
+                task = asyncio.create_task(handle_request_logged(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            except Exception as e:
+                # Log to stderr so it doesn't interfere with JSON-RPC
+                print(f"Error: {e}", file=sys.stderr)
+                break
+    finally:
+        # Let in-flight tool calls finish and respond before closing clients
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await shutdown_http_clients()
 
-        except Exception as e:
-            # Log to stderr so it doesn't interfere with JSON-RPC
-            print(f"Error: {e}", file=sys.stderr)
-            break
+
+async def shutdown_http_clients() -> None:
+    """Close the shared PagerDuty and Confluence clients."""
+    await pagerduty_shutdown()
+    await confluence_shutdown()
+
+
+@atexit.register
+def _shutdown_http_clients_at_exit() -> None:
+    """Close the clients at interpreter exit if main() didn't already."""
+    if _pd_client is None and _confluence_client is None:
+        return
+    try:
+        asyncio.run(shutdown_http_clients())
+    except Exception as e:
+        # Best-effort: a loop may still be running, or the clients' loop is
+        # gone and httpx/anyio fail to close on it; the sockets are reclaimed
+        # when the process exits
+        print(f"Skipped HTTP client cleanup at exit: {e!r}", file=sys.stderr)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when available for lower per-await overhead
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
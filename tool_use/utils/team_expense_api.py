@@ -9,13 +9,410 @@ and budget limits by employee level.
 import json
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
+
+# orjson serializes the expense payloads several times faster than json. The fallback matches
+# its compact separators and unescaped UTF-8, so these responses read the same either way
+# (the two only differ on float exponent notation, which the amounts here never reach).
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 
 # Configuration
 EXPENSE_LINE_ITEMS_PER_PERSON_MIN = 20
 EXPENSE_LINE_ITEMS_PER_PERSON_MAX = 50
 DELAY_MULTIPLIER = 0  # Adjust this to simulate API latency
 
+# Mock team data by department
+TEAMS = {
+    "engineering": [
+        {
+            "id": "ENG001",
+            "name": "Alice Chen",
+            "role": "Senior Software Engineer",
+            "level": "senior",
+            "email": "alice.chen@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG002",
+            "name": "Bob Martinez",
+            "role": "Staff Engineer",
+            "level": "staff",
+            "email": "bob.martinez@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG003",
+            "name": "Carol White",
+            "role": "Software Engineer",
+            "level": "mid",
+            "email": "carol.white@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG004",
+            "name": "David Kim",
+            "role": "Principal Engineer",
+            "level": "principal",
+            "email": "david.kim@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG005",
+            "name": "Emma Johnson",
+            "role": "Junior Software Engineer",
+            "level": "junior",
+            "email": "emma.johnson@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG006",
+            "name": "Frank Liu",
+            "role": "Senior Software Engineer",
+            "level": "senior",
+            "email": "frank.liu@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG007",
+            "name": "Grace Taylor",
+            "role": "Software Engineer",
+            "level": "mid",
+            "email": "grace.taylor@company.com",
+            "department": "engineering",
+        },
+        {
+            "id": "ENG008",
+            "name": "Henry Park",
+            "role": "Staff Engineer",
+            "level": "staff",
+            "email": "henry.park@company.com",
+            "department": "engineering",
+        },
+    ],
+    "sales": [
+        {
+            "id": "SAL001",
+            "name": "Irene Davis",
+            "role": "Account Executive",
+            "level": "mid",
+            "email": "irene.davis@company.com",
+            "department": "sales",
+        },
+        {
+            "id": "SAL002",
+            "name": "Jack Wilson",
+            "role": "Senior Account Executive",
+            "level": "senior",
+            "email": "jack.wilson@company.com",
+            "department": "sales",
+        },
+        {
+            "id": "SAL003",
+            "name": "Kelly Brown",
+            "role": "Sales Development Rep",
+            "level": "junior",
+            "email": "kelly.brown@company.com",
+            "department": "sales",
+        },
+        {
+            "id": "SAL004",
+            "name": "Leo Garcia",
+            "role": "Regional Sales Director",
+            "level": "staff",
+            "email": "leo.garcia@company.com",
+            "department": "sales",
+        },
+        {
+            "id": "SAL005",
+            "name": "Maya Patel",
+            "role": "Account Executive",
+            "level": "mid",
+            "email": "maya.patel@company.com",
+            "department": "sales",
+        },
+        {
+            "id": "SAL006",
+            "name": "Nathan Scott",
+            "role": "VP of Sales",
+            "level": "principal",
+            "email": "nathan.scott@company.com",
+            "department": "sales",
+        },
+    ],
+    "marketing": [
+        {
+            "id": "MKT001",
+            "name": "Olivia Thompson",
+            "role": "Marketing Manager",
+            "level": "senior",
+            "email": "olivia.thompson@company.com",
+            "department": "marketing",
+        },
+        {
+            "id": "MKT002",
+            "name": "Peter Anderson",
+            "role": "Content Specialist",
+            "level": "mid",
+            "email": "peter.anderson@company.com",
+            "department": "marketing",
+        },
+        {
+            "id": "MKT003",
+            "name": "Quinn Rodriguez",
+            "role": "Marketing Coordinator",
+            "level": "junior",
+            "email": "quinn.rodriguez@company.com",
+            "department": "marketing",
+        },
+        {
+            "id": "MKT004",
+            "name": "Rachel Lee",
+            "role": "Director of Marketing",
+            "level": "staff",
+            "email": "rachel.lee@company.com",
+            "department": "marketing",
+        },
+        {
+            "id": "MKT005",
+            "name": "Sam Miller",
+            "role": "Social Media Manager",
+            "level": "mid",
+            "email": "sam.miller@company.com",
+            "department": "marketing",
+        },
+    ],
+}
+
+# Employees with custom budget exceptions
+CUSTOM_BUDGETS = {
+    "ENG002": {
+        "user_id": "ENG002",
+        "has_custom_budget": True,
+        "travel_budget": 8000,
+        "reason": "Staff engineer with regular client site visits",
+        "currency": "USD",
+    },
+    "ENG004": {
+        "user_id": "ENG004",
+        "has_custom_budget": True,
+        "travel_budget": 12000,
+        "reason": "Principal engineer leading distributed team across multiple offices",
+        "currency": "USD",
+    },
+    "SAL004": {
+        "user_id": "SAL004",
+        "has_custom_budget": True,
+        "travel_budget": 15000,
+        "reason": "Regional sales director covering west coast territory",
+        "currency": "USD",
+    },
+    "SAL006": {
+        "user_id": "SAL006",
+        "has_custom_budget": True,
+        "travel_budget": 20000,
+        "reason": "VP of Sales with extensive client travel requirements",
+        "currency": "USD",
+    },
+    "MKT004": {
+        "user_id": "MKT004",
+        "has_custom_budget": True,
+        "travel_budget": 10000,
+        "reason": "Director of Marketing attending industry conferences and partner meetings",
+        "currency": "USD",
+    },
+}
+
+# The tables never change, so their JSON responses are serialized once at import
+TEAMS_JSON = {department: json_dumps(members) for department, members in TEAMS.items()}
+CUSTOM_BUDGETS_JSON = {user_id: json_dumps(budget) for user_id, budget in CUSTOM_BUDGETS.items()}
+
+# Manager names for approvals
+MANAGERS = [
+    "Sarah Johnson",
+    "Michael Chen",
+    "Emily Rodriguez",
+    "David Park",
+    "Jennifer Martinez",
+]
+
+# Store/merchant names by category
+MERCHANTS = {
+    "travel": [
+        "United Airlines",
+        "Delta",
+        "American Airlines",
+        "Southwest",
+        "Enterprise Rent-A-Car",
+    ],
+    "lodging": ["Marriott", "Hilton", "Hyatt", "Airbnb", "Holiday Inn"],
+    "meals": ["Olive Garden", "Starbucks", "The Capital Grille", "Chipotle", "Panera Bread"],
+    "software": ["AWS", "GitHub", "Linear", "Notion", "Figma"],
+    "equipment": ["Amazon", "Best Buy", "Apple Store", "B&H Photo", "Newegg"],
+    "conference": ["EventBrite", "WWDC", "AWS re:Invent", "Google I/O", "ReactConf"],
+    "office": ["Staples", "Office Depot", "Amazon", "Target"],
+    "internet": ["Verizon", "AT&T", "T-Mobile", "Comcast"],
+}
+
+# US cities for store locations
+CITIES = [
+    "San Francisco, CA",
+    "New York, NY",
+    "Austin, TX",
+    "Seattle, WA",
+    "Boston, MA",
+    "Chicago, IL",
+    "Denver, CO",
+    "Los Angeles, CA",
+    "Portland, OR",
+    "Miami, FL",
+]
+
+# Project codes
+PROJECT_CODES = [
+    "PROJ-1001",
+    "PROJ-1002",
+    "PROJ-2001",
+    "DEPT-ENG",
+    "DEPT-OPS",
+    "CLIENT-A",
+    "CLIENT-B",
+]
+
+# Justification templates
+JUSTIFICATIONS = {
+    "travel": [
+        "Client meeting to discuss Q4 roadmap and requirements",
+        "On-site visit for infrastructure review and planning",
+        "Conference attendance for professional development",
+        "Team offsite for strategic planning session",
+        "Customer presentation and product demo",
+    ],
+    "lodging": [
+        "Hotel for multi-day client visit",
+        "Accommodation during conference attendance",
+        "Extended stay for project implementation",
+        "Lodging for team collaboration week",
+    ],
+    "meals": [
+        "Client dinner discussing partnership opportunities",
+        "Team lunch during sprint planning",
+        "Breakfast meeting with stakeholders",
+        "Working dinner during crunch period",
+    ],
+    "software": [
+        "Required tool for development workflow",
+        "API credits for production workload",
+        "Team collaboration platform subscription",
+        "Design and prototyping tool license",
+    ],
+    "equipment": [
+        "Replacing failed hardware",
+        "Upgraded monitor for productivity",
+        "Required for remote work setup",
+        "Better equipment for video calls",
+    ],
+    "conference": [
+        "Professional development - learning new technologies",
+        "Networking with industry leaders and potential partners",
+        "Presenting company work at industry event",
+        "Training workshop for certification",
+    ],
+    "office": [
+        "Supplies for home office setup",
+        "Reference materials for project work",
+        "Team whiteboarding supplies",
+    ],
+    "internet": [
+        "Mobile hotspot for reliable connectivity",
+        "Upgraded internet for remote work",
+        "International data plan for travel",
+    ],
+}
+
+# Expense approval statuses and their relative frequency (most are approved)
+STATUSES = ["approved", "pending", "rejected"]
+STATUS_WEIGHTS = [0.85, 0.10, 0.05]
+PAYMENT_METHODS = ["corporate_card", "personal_reimbursement"]
+
+# Expense categories and typical amounts as (category, description, min, max)
+EXPENSE_CATEGORIES = [
+    ("travel", "Flight to client meeting", 400, 1500),
+    ("travel", "Train ticket", 1000, 1500),
+    ("travel", "Rental car", 1000, 1500),
+    ("travel", "Taxi/Uber", 150, 200),
+    ("travel", "Parking fee", 10, 50),
+    ("lodging", "Hotel stay", 150, 1900),
+    ("lodging", "Airbnb rental", 1000, 1950),
+    ("meals", "Client dinner", 50, 250),
+    ("meals", "Team lunch", 20, 100),
+    ("meals", "Conference breakfast", 15, 40),
+    ("meals", "Coffee meeting", 5, 25),
+    ("software", "SaaS subscription", 10, 200),
+    ("software", "API credits", 50, 500),
+    ("equipment", "Monitor", 200, 800),
+    ("equipment", "Keyboard", 50, 200),
+    ("equipment", "Webcam", 50, 150),
+    ("equipment", "Headphones", 100, 300),
+    ("conference", "Conference ticket", 500, 2500),
+    ("conference", "Workshop registration", 200, 1000),
+    ("office", "Office supplies", 10, 100),
+    ("office", "Books", 20, 80),
+    ("internet", "Mobile data", 30, 100),
+    ("internet", "WiFi hotspot", 20, 60),
+]
+
+# Column view of EXPENSE_CATEGORIES so an item's fields are fetched by a single index
+CATEGORY_NAMES, CATEGORY_DESCRIPTIONS, CATEGORY_MINS, CATEGORY_MAXS = zip(
+    *EXPENSE_CATEGORIES, strict=True
+)
+
+# Quarter date ranges
+QUARTER_DATES = {
+    "Q1": (datetime(2024, 1, 1), datetime(2024, 3, 31)),
+    "Q2": (datetime(2024, 4, 1), datetime(2024, 6, 30)),
+    "Q3": (datetime(2024, 7, 1), datetime(2024, 9, 30)),
+    "Q4": (datetime(2024, 10, 1), datetime(2024, 12, 31)),
+}
+
+# Formatted dates for each day of a quarter, indexed by days since the quarter start. The
+# extra 30 days cover the latest possible reimbursement date.
+QUARTER_DATE_STRS = {
+    quarter: tuple(
+        (start_date + timedelta(days=days)).strftime("%Y-%m-%d")
+        for days in range((end_date - start_date).days + 31)
+    )
+    for quarter, (start_date, end_date) in QUARTER_DATES.items()
+}
+
+
+def _get_team_members_obj(department: str) -> list[dict[str, Any]] | dict[str, str]:
+    """Same as get_team_members, but returns the parsed object for in-process callers."""
+    if DELAY_MULTIPLIER:
+        time.sleep(DELAY_MULTIPLIER * 0.1)
+
+    department = department.lower()
+
+    if department not in TEAMS:
+        return {
+            "error": f"Department '{department}' not found. Available departments: {', '.join(TEAMS)}"
+        }
+
+    return TEAMS[department]
+
 
 def get_team_members(department: str) -> str:
     """Returns a list of team members for a given department.
@@ -36,182 +433,88 @@ def get_team_members(department: str) -> str:
         - email: Contact email
         - department: Department name
     """
-    import time
+    members = _get_team_members_obj(department)
+    return TEAMS_JSON.get(department.lower()) or json_dumps(members)
 
-    time.sleep(DELAY_MULTIPLIER * 0.1)
 
-    department = department.lower()
+def _get_expenses_obj(employee_id: str, quarter: str) -> list[dict[str, Any]] | dict[str, str]:
+    """Same as get_expenses, but returns the parsed object for in-process callers."""
+    if DELAY_MULTIPLIER:
+        time.sleep(DELAY_MULTIPLIER * 0.2)
 
-    # Mock team data by department
-    teams = {
-        "engineering": [
-            {
-                "id": "ENG001",
-                "name": "Alice Chen",
-                "role": "Senior Software Engineer",
-                "level": "senior",
-                "email": "alice.chen@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG002",
-                "name": "Bob Martinez",
-                "role": "Staff Engineer",
-                "level": "staff",
-                "email": "bob.martinez@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG003",
-                "name": "Carol White",
-                "role": "Software Engineer",
-                "level": "mid",
-                "email": "carol.white@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG004",
-                "name": "David Kim",
-                "role": "Principal Engineer",
-                "level": "principal",
-                "email": "david.kim@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG005",
-                "name": "Emma Johnson",
-                "role": "Junior Software Engineer",
-                "level": "junior",
-                "email": "emma.johnson@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG006",
-                "name": "Frank Liu",
-                "role": "Senior Software Engineer",
-                "level": "senior",
-                "email": "frank.liu@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG007",
-                "name": "Grace Taylor",
-                "role": "Software Engineer",
-                "level": "mid",
-                "email": "grace.taylor@company.com",
-                "department": "engineering",
-            },
-            {
-                "id": "ENG008",
-                "name": "Henry Park",
-                "role": "Staff Engineer",
-                "level": "staff",
-                "email": "henry.park@company.com",
-                "department": "engineering",
-            },
-        ],
-        "sales": [
-            {
-                "id": "SAL001",
-                "name": "Irene Davis",
-                "role": "Account Executive",
-                "level": "mid",
-                "email": "irene.davis@company.com",
-                "department": "sales",
-            },
-            {
-                "id": "SAL002",
-                "name": "Jack Wilson",
-                "role": "Senior Account Executive",
-                "level": "senior",
-                "email": "jack.wilson@company.com",
-                "department": "sales",
-            },
-            {
-                "id": "SAL003",
-                "name": "Kelly Brown",
-                "role": "Sales Development Rep",
-                "level": "junior",
-                "email": "kelly.brown@company.com",
-                "department": "sales",
-            },
-            {
-                "id": "SAL004",
-                "name": "Leo Garcia",
-                "role": "Regional Sales Director",
-                "level": "staff",
-                "email": "leo.garcia@company.com",
-                "department": "sales",
-            },
-            {
-                "id": "SAL005",
-                "name": "Maya Patel",
-                "role": "Account Executive",
-                "level": "mid",
-                "email": "maya.patel@company.com",
-                "department": "sales",
-            },
-            {
-                "id": "SAL006",
-                "name": "Nathan Scott",
-                "role": "VP of Sales",
-                "level": "principal",
-                "email": "nathan.scott@company.com",
-                "department": "sales",
-            },
-        ],
-        "marketing": [
-            {
-                "id": "MKT001",
-                "name": "Olivia Thompson",
-                "role": "Marketing Manager",
-                "level": "senior",
-                "email": "olivia.thompson@company.com",
-                "department": "marketing",
-            },
-            {
-                "id": "MKT002",
-                "name": "Peter Anderson",
-                "role": "Content Specialist",
-                "level": "mid",
-                "email": "peter.anderson@company.com",
-                "department": "marketing",
-            },
-            {
-                "id": "MKT003",
-                "name": "Quinn Rodriguez",
-                "role": "Marketing Coordinator",
-                "level": "junior",
-                "email": "quinn.rodriguez@company.com",
-                "department": "marketing",
-            },
-            {
-                "id": "MKT004",
-                "name": "Rachel Lee",
-                "role": "Director of Marketing",
-                "level": "staff",
-                "email": "rachel.lee@company.com",
-                "department": "marketing",
-            },
-            {
-                "id": "MKT005",
-                "name": "Sam Miller",
-                "role": "Social Media Manager",
-                "level": "mid",
-                "email": "sam.miller@company.com",
-                "department": "marketing",
-            },
-        ],
-    }
+    # Generate a deterministic but varied number of expenses based on employee_id. A private
+    # generator keeps concurrent calls from reseeding each other through the global one.
+    rng = random.Random(hash(employee_id + quarter))
+    choice, choices, randint, uniform = rng.choice, rng.choices, rng.randint, rng.uniform
+    randrange = rng.randrange
+    num_expenses = randint(EXPENSE_LINE_ITEMS_PER_PERSON_MIN, EXPENSE_LINE_ITEMS_PER_PERSON_MAX)
+
+    if quarter.upper() not in QUARTER_DATES:
+        return {"error": f"Invalid quarter '{quarter}'. Must be Q1, Q2, Q3, or Q4"}
+
+    start_date, end_date = QUARTER_DATES[quarter.upper()]
+    days_diff = (end_date - start_date).days
+    date_strs = QUARTER_DATE_STRS[quarter.upper()]
+    num_categories = len(CATEGORY_NAMES)
+
+    # Expense ids and receipt URLs only differ per item by their sequence number
+    id_prefix = f"{employee_id}_{quarter}_"
+    receipt_prefix = f"https://receipts.company.com/{employee_id}/{quarter}/"
+
+    expenses = []
+    for i in range(num_expenses):
+        c = randrange(num_categories)
+        category, desc_template = CATEGORY_NAMES[c], CATEGORY_DESCRIPTIONS[c]
+        min_amt, max_amt = CATEGORY_MINS[c], CATEGORY_MAXS[c]
+
+        # Generate random date within quarter
+        random_days = randint(0, days_diff)
+
+        # Generate amount
+        amount = round(uniform(min_amt, max_amt), 2)
 
-    if department not in teams:
-        return json.dumps(
+        # Status (most are approved)
+        status = choices(STATUSES, weights=STATUS_WEIGHTS)[0]
+
+        # Generate additional metadata
+        approved_by = choice(MANAGERS) if status == "approved" else None
+        store_name = choice(MERCHANTS.get(category, ["Unknown Merchant"]))
+        store_location = choice(CITIES)
+        payment_method = choice(PAYMENT_METHODS)
+        project_code = choice(PROJECT_CODES)
+        notes = choice(JUSTIFICATIONS.get(category, ["Business expense"]))
+
+        # Reimbursement date is 15-30 days after expense date for approved expenses
+        reimbursement_date = None
+        if status == "approved" and payment_method == "personal_reimbursement":
+            reimb_days = randint(15, 30)
+            reimbursement_date = date_strs[random_days + reimb_days]
+
+        seq = f"{i:03d}"
+        expenses.append(
             {
-                "error": f"Department '{department}' not found. Available departments: {', '.join(teams.keys())}"
+                "expense_id": id_prefix + seq,
+                "date": date_strs[random_days],
+                "category": category,
+                "description": desc_template,
+                "amount": amount,
+                "currency": "USD",
+                "status": status,
+                "receipt_url": f"{receipt_prefix}{seq}.pdf",
+                "approved_by": approved_by,
+                "store_name": store_name,
+                "store_location": store_location,
+                "reimbursement_date": reimbursement_date,
+                "payment_method": payment_method,
+                "project_code": project_code,
+                "notes": notes,
             }
         )
 
-    return json.dumps(teams[department], indent=2)
+    # Sort by date
+    expenses.sort(key=itemgetter("date"))
+
+    return expenses
 
 
 def get_expenses(employee_id: str, quarter: str) -> str:
@@ -244,211 +547,89 @@ def get_expenses(employee_id: str, quarter: str) -> str:
         - project_code: Project or cost center code
         - notes: Employee justification or additional context
     """
+    return json_dumps(_get_expenses_obj(employee_id, quarter))
+
+
+# Categories that count against an employee's travel budget
+TRAVEL_BUDGET_CATEGORIES = frozenset(("travel", "lodging"))
+
+
+def _get_expense_summary_obj(employee_id: str, quarter: str) -> dict[str, Any]:
+    """Same as get_expense_summary, but returns the parsed object for in-process callers."""
+    expenses = _get_expenses_obj(employee_id, quarter)
+    if isinstance(expenses, dict):
+        return expenses
+
+    approved_count = 0
+    approved_total = 0
+    approved_travel_total = 0
+    for exp in expenses:
+        if exp["status"] == "approved":
+            approved_count += 1
+            approved_total += exp["amount"]
+            if exp["category"] in TRAVEL_BUDGET_CATEGORIES:
+                approved_travel_total += exp["amount"]
+
+    return {
+        "employee_id": employee_id,
+        "quarter": quarter,
+        "count": len(expenses),
+        "approved_count": approved_count,
+        "approved_total": round(approved_total, 2),
+        "approved_travel_total": round(approved_travel_total, 2),
+    }
 
-    time.sleep(DELAY_MULTIPLIER * 0.2)
-
-    # Generate a deterministic but varied number of expenses based on employee_id
-    random.seed(hash(employee_id + quarter))
-    num_expenses = random.randint(
-        EXPENSE_LINE_ITEMS_PER_PERSON_MIN, EXPENSE_LINE_ITEMS_PER_PERSON_MAX
-    )
 
-    # Quarter date ranges
-    quarter_dates = {
-        "Q1": (datetime(2024, 1, 1), datetime(2024, 3, 31)),
-        "Q2": (datetime(2024, 4, 1), datetime(2024, 6, 30)),
-        "Q3": (datetime(2024, 7, 1), datetime(2024, 9, 30)),
-        "Q4": (datetime(2024, 10, 1), datetime(2024, 12, 31)),
-    }
+def get_expense_summary(employee_id: str, quarter: str) -> str:
+    """Returns aggregate totals of an employee's expenses for a specific quarter.
 
-    if quarter.upper() not in quarter_dates:
-        return json.dumps({"error": f"Invalid quarter '{quarter}'. Must be Q1, Q2, Q3, or Q4"})
-
-    start_date, end_date = quarter_dates[quarter.upper()]
-
-    # Expense categories and typical amounts
-    expense_categories = [
-        ("travel", "Flight to client meeting", 400, 1500),
-        ("travel", "Train ticket", 1000, 1500),
-        ("travel", "Rental car", 1000, 1500),
-        ("travel", "Taxi/Uber", 150, 200),
-        ("travel", "Parking fee", 10, 50),
-        ("lodging", "Hotel stay", 150, 1900),
-        ("lodging", "Airbnb rental", 1000, 1950),
-        ("meals", "Client dinner", 50, 250),
-        ("meals", "Team lunch", 20, 100),
-        ("meals", "Conference breakfast", 15, 40),
-        ("meals", "Coffee meeting", 5, 25),
-        ("software", "SaaS subscription", 10, 200),
-        ("software", "API credits", 50, 500),
-        ("equipment", "Monitor", 200, 800),
-        ("equipment", "Keyboard", 50, 200),
-        ("equipment", "Webcam", 50, 150),
-        ("equipment", "Headphones", 100, 300),
-        ("conference", "Conference ticket", 500, 2500),
-        ("conference", "Workshop registration", 200, 1000),
-        ("office", "Office supplies", 10, 100),
-        ("office", "Books", 20, 80),
-        ("internet", "Mobile data", 30, 100),
-        ("internet", "WiFi hotspot", 20, 60),
-    ]
-
-    # Manager names for approvals
-    managers = [
-        "Sarah Johnson",
-        "Michael Chen",
-        "Emily Rodriguez",
-        "David Park",
-        "Jennifer Martinez",
-    ]
-
-    # Store/merchant names by category
-    merchants = {
-        "travel": [
-            "United Airlines",
-            "Delta",
-            "American Airlines",
-            "Southwest",
-            "Enterprise Rent-A-Car",
-        ],
-        "lodging": ["Marriott", "Hilton", "Hyatt", "Airbnb", "Holiday Inn"],
-        "meals": ["Olive Garden", "Starbucks", "The Capital Grille", "Chipotle", "Panera Bread"],
-        "software": ["AWS", "GitHub", "Linear", "Notion", "Figma"],
-        "equipment": ["Amazon", "Best Buy", "Apple Store", "B&H Photo", "Newegg"],
-        "conference": ["EventBrite", "WWDC", "AWS re:Invent", "Google I/O", "ReactConf"],
-        "office": ["Staples", "Office Depot", "Amazon", "Target"],
-        "internet": ["Verizon", "AT&T", "T-Mobile", "Comcast"],
-    }
+    Covers the same line items as get_expenses, but only returns the totals, so use
+    this when the individual expenses are not needed.
 
-    # US cities for store locations
-    cities = [
-        "San Francisco, CA",
-        "New York, NY",
-        "Austin, TX",
-        "Seattle, WA",
-        "Boston, MA",
-        "Chicago, IL",
-        "Denver, CO",
-        "Los Angeles, CA",
-        "Portland, OR",
-        "Miami, FL",
-    ]
-
-    # Project codes
-    project_codes = [
-        "PROJ-1001",
-        "PROJ-1002",
-        "PROJ-2001",
-        "DEPT-ENG",
-        "DEPT-OPS",
-        "CLIENT-A",
-        "CLIENT-B",
-    ]
-
-    # Justification templates
-    justifications = {
-        "travel": [
-            "Client meeting to discuss Q4 roadmap and requirements",
-            "On-site visit for infrastructure review and planning",
-            "Conference attendance for professional development",
-            "Team offsite for strategic planning session",
-            "Customer presentation and product demo",
-        ],
-        "lodging": [
-            "Hotel for multi-day client visit",
-            "Accommodation during conference attendance",
-            "Extended stay for project implementation",
-            "Lodging for team collaboration week",
-        ],
-        "meals": [
-            "Client dinner discussing partnership opportunities",
-            "Team lunch during sprint planning",
-            "Breakfast meeting with stakeholders",
-            "Working dinner during crunch period",
-        ],
-        "software": [
-            "Required tool for development workflow",
-            "API credits for production workload",
-            "Team collaboration platform subscription",
-            "Design and prototyping tool license",
-        ],
-        "equipment": [
-            "Replacing failed hardware",
-            "Upgraded monitor for productivity",
-            "Required for remote work setup",
-            "Better equipment for video calls",
-        ],
-        "conference": [
-            "Professional development - learning new technologies",
-            "Networking with industry leaders and potential partners",
-            "Presenting company work at industry event",
-            "Training workshop for certification",
-        ],
-        "office": [
-            "Supplies for home office setup",
-            "Reference materials for project work",
-            "Team whiteboarding supplies",
-        ],
-        "internet": [
-            "Mobile hotspot for reliable connectivity",
-            "Upgraded internet for remote work",
-            "International data plan for travel",
-        ],
-    }
+    Args:
+        employee_id: The unique employee identifier (e.g., 'ENG001', 'SAL002')
+        quarter: Quarter identifier (e.g., 'Q1', 'Q2', 'Q3', 'Q4')
 
-    expenses = []
-    for i in range(num_expenses):
-        category, desc_template, min_amt, max_amt = random.choice(expense_categories)
+    Returns:
+        JSON string containing:
+        - employee_id: Employee identifier
+        - quarter: Quarter identifier
+        - count: Number of expense line items
+        - approved_count: Number of approved line items
+        - approved_total: Dollar total of approved line items
+        - approved_travel_total: Dollar total of approved travel and lodging line items,
+          the categories covered by the travel budget
+    """
+    return json_dumps(_get_expense_summary_obj(employee_id, quarter))
 
-        # Generate random date within quarter
-        days_diff = (end_date - start_date).days
-        random_days = random.randint(0, days_diff)
-        expense_date = start_date + timedelta(days=random_days)
 
-        # Generate amount
-        amount = round(random.uniform(min_amt, max_amt), 2)
+def _get_custom_budget_obj(user_id: str) -> dict[str, Any]:
+    """Same as get_custom_budget, but returns the parsed object for in-process callers."""
+    if DELAY_MULTIPLIER:
+        time.sleep(DELAY_MULTIPLIER * 0.05)
 
-        # Status (most are approved)
-        status = random.choices(["approved", "pending", "rejected"], weights=[0.85, 0.10, 0.05])[0]
+    # Check if user has custom budget
+    if user_id in CUSTOM_BUDGETS:
+        return CUSTOM_BUDGETS[user_id]
 
-        # Generate additional metadata
-        approved_by = random.choice(managers) if status == "approved" else None
-        store_name = random.choice(merchants.get(category, ["Unknown Merchant"]))
-        store_location = random.choice(cities)
-        payment_method = random.choice(["corporate_card", "personal_reimbursement"])
-        project_code = random.choice(project_codes)
-        notes = random.choice(justifications.get(category, ["Business expense"]))
+    # Return standard budget
+    return _standard_budget(user_id)
 
-        # Reimbursement date is 15-30 days after expense date for approved expenses
-        reimbursement_date = None
-        if status == "approved" and payment_method == "personal_reimbursement":
-            reimb_days = random.randint(15, 30)
-            reimbursement_date = (expense_date + timedelta(days=reimb_days)).strftime("%Y-%m-%d")
 
-        expenses.append(
-            {
-                "expense_id": f"{employee_id}_{quarter}_{i:03d}",
-                "date": expense_date.strftime("%Y-%m-%d"),
-                "category": category,
-                "description": desc_template,
-                "amount": amount,
-                "currency": "USD",
-                "status": status,
-                "receipt_url": f"https://receipts.company.com/{employee_id}/{quarter}/{i:03d}.pdf",
-                "approved_by": approved_by,
-                "store_name": store_name,
-                "store_location": store_location,
-                "reimbursement_date": reimbursement_date,
-                "payment_method": payment_method,
-                "project_code": project_code,
-                "notes": notes,
-            }
-        )
+def _standard_budget(user_id: str) -> dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "has_custom_budget": False,
+        "travel_budget": 5000,
+        "reason": "Standard quarterly travel budget",
+        "currency": "USD",
+    }
 
-    # Sort by date
-    expenses.sort(key=lambda x: x["date"])
 
-    return json.dumps(expenses, indent=2)
+# Standard budgets depend only on the user_id, so their JSON is serialized once per user
+@lru_cache(maxsize=1024)
+def _standard_budget_json(user_id: str) -> str:
+    return json_dumps(_standard_budget(user_id))
 
 
 def get_custom_budget(user_id: str) -> str:
@@ -469,62 +650,10 @@ def get_custom_budget(user_id: str) -> str:
         - reason: Explanation for custom budget (if applicable)
         - currency: Currency code (default 'USD')
     """
-    time.sleep(DELAY_MULTIPLIER * 0.05)
-
-    # Employees with custom budget exceptions
-    custom_budgets = {
-        "ENG002": {
-            "user_id": "ENG002",
-            "has_custom_budget": True,
-            "travel_budget": 8000,
-            "reason": "Staff engineer with regular client site visits",
-            "currency": "USD",
-        },
-        "ENG004": {
-            "user_id": "ENG004",
-            "has_custom_budget": True,
-            "travel_budget": 12000,
-            "reason": "Principal engineer leading distributed team across multiple offices",
-            "currency": "USD",
-        },
-        "SAL004": {
-            "user_id": "SAL004",
-            "has_custom_budget": True,
-            "travel_budget": 15000,
-            "reason": "Regional sales director covering west coast territory",
-            "currency": "USD",
-        },
-        "SAL006": {
-            "user_id": "SAL006",
-            "has_custom_budget": True,
-            "travel_budget": 20000,
-            "reason": "VP of Sales with extensive client travel requirements",
-            "currency": "USD",
-        },
-        "MKT004": {
-            "user_id": "MKT004",
-            "has_custom_budget": True,
-            "travel_budget": 10000,
-            "reason": "Director of Marketing attending industry conferences and partner meetings",
-            "currency": "USD",
-        },
-    }
-
-    # Check if user has custom budget
-    if user_id in custom_budgets:
-        return json.dumps(custom_budgets[user_id], indent=2)
+    if DELAY_MULTIPLIER:
+        time.sleep(DELAY_MULTIPLIER * 0.05)
 
-    # Return standard budget
-    return json.dumps(
-        {
-            "user_id": user_id,
-            "has_custom_budget": False,
-            "travel_budget": 5000,
-            "reason": "Standard quarterly travel budget",
-            "currency": "USD",
-        },
-        indent=2,
-    )
+    return CUSTOM_BUDGETS_JSON.get(user_id) or _standard_budget_json(user_id)
 
 
 # Helper function to get all available tools
@@ -538,30 +667,31 @@ if __name__ == "__main__":
     print("=== Team Expense Analysis Example ===\n")
 
     # Get team members
-    team = json.loads(get_team_members("engineering"))
+    team = _get_team_members_obj("engineering")
+    members = team[:5]  # Just check first 5 for demo
 
-    exceeded_standard = []
-    for member in team[:5]:  # Just check first 5 for demo
-        print(f"Checking expenses for {member['name']}...")
+    def check_member(member):
+        # Only the totals are needed, not the individual line items (could be 100+)
+        summary = _get_expense_summary_obj(member["id"], "Q3")
+        travel_total = summary["approved_travel_total"]
 
-        # Fetch this person's expenses (could be 100+ line items)
-        expenses = json.loads(get_expenses(member["id"], "Q3"))
+        # Only over-budget employees need their custom budget exception looked up
+        custom = _get_custom_budget_obj(member["id"]) if travel_total > 5000 else None
+        return summary, travel_total, custom
 
-        # Calculate total travel expenses
-        travel_total = sum(
-            exp["amount"]
-            for exp in expenses
-            if exp["status"] == "approved" and exp["category"] in ["travel", "lodging"]
-        )
+    # Look up all members concurrently; map() yields results in team order for printing
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(check_member, members))
 
-        print(f"  - Found {len(expenses)} expense line items")
+    exceeded_standard = []
+    for member, (summary, travel_total, custom) in zip(members, results, strict=True):
+        print(f"Checking expenses for {member['name']}...")
+        print(f"  - Found {summary['count']} expense line items")
         print(f"  - Total approved travel expenses: ${travel_total:,.2f}")
 
         # Check against standard $5,000 budget
         if travel_total > 5000:
             print("  ⚠️  Exceeded standard $5,000 budget")
-            # Now check if they have a custom budget exception
-            custom = json.loads(get_custom_budget(member["id"]))
             print(f"  - Custom budget: ${custom['travel_budget']:,}")
 
             if travel_total > custom["travel_budget"]: